@@ -5,8 +5,6 @@ from pathlib import Path
 
 import click
 
-from .cli_runner import CliRunner
-
 
 @click.command()
 @click.option(
@@ -24,10 +22,23 @@ from .cli_runner import CliRunner
     help="Output directory (default: ./output)",
 )
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
+@click.option("--fast", is_flag=True, help="Use fast PNG compression (larger files, for iteration runs)")
+@click.option(
+    "-j", "--jobs", type=int, default=1, help="Number of parallel worker processes; 0 uses all cores (default: 1)"
+)
 @click.option("--validate-only", is_flag=True, help="Validate configuration without generating images")
 @click.option("-l", "--language", help="Specific language to generate (generates all if not specified)")
 @click.option("--show-options", is_flag=True, help="Show all available configuration options with descriptions")
-def main(config: Path, output: Path, verbose: bool, validate_only: bool, language: str, show_options: bool) -> None:
+def main(
+    config: Path,
+    output: Path,
+    verbose: bool,
+    fast: bool,
+    jobs: int,
+    validate_only: bool,
+    language: str,
+    show_options: bool,
+) -> None:
     """Generate App Store Connect screenshots with text overlays.
 
     This tool reads a YML configuration file and generates screenshots
@@ -36,6 +47,9 @@ def main(config: Path, output: Path, verbose: bool, validate_only: bool, languag
     Example:
         appscreenshots -c config.yml
     """
+    # Imported lazily so `--help` (shell tab completion) stays Click-only
+    from .cli_runner import CliRunner
+
     # Initialize CLI runner
     runner = CliRunner(verbose=verbose)
 
@@ -51,7 +65,7 @@ def main(config: Path, output: Path, verbose: bool, validate_only: bool, languag
 
     # Execute screenshot generation
     exit_code = runner.generate_screenshots(
-        config_path=config, output_dir=output, language=language, validate_only=validate_only
+        config_path=config, output_dir=output, language=language, validate_only=validate_only, fast=fast, jobs=jobs
     )
 
     if exit_code != 0:
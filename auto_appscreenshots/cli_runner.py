@@ -3,18 +3,18 @@
 import logging
 import os
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from .config_docs import format_configuration_docs
-from .config_manager import ConfigManager
-from .generator import ScreenshotGenerator
-from .models import ScreenshotConfig
-from .preset_themes import PresetThemes
-from .ui_reporter import ConsoleReporter
-from .validator import ConfigValidator
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+    from .models import ScreenshotConfig
+
+# Heavy modules (Pillow, Pydantic, the generator graph) are imported lazily
+# inside the methods that need them so `--help`/`--show-options` stay fast.
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +30,23 @@ class ColoredWarningFormatter(logging.Formatter):
             and not os.environ.get("NO_COLOR")
             and os.environ.get("TERM", "") != "dumb"
         )
+        # Precomputed per-formatter so each warning record only pays for
+        # string concatenation, not TTY/env checks
+        self._prefix = "\033[1;33m⚠️  " if self.use_colors else "⚠️  "
+        self._suffix = "\033[0m" if self.use_colors else ""
 
     def format(self, record: logging.LogRecord) -> str:
-        if record.levelno == logging.WARNING:
-            msg = record.getMessage()
-            if "⚠️" not in msg:
-                record.msg = f"⚠️  {record.msg}"
-            if self.use_colors:
-                record.msg = f"\033[1;33m{record.msg}\033[0m"
+        if record.levelno != logging.WARNING:
+            return super().format(record)
+
+        # Decorate once even if the record passes through multiple handlers
+        if not getattr(record, "_warning_decorated", False):
+            if "⚠️" in record.getMessage():
+                if self.use_colors:
+                    record.msg = f"\033[1;33m{record.msg}{self._suffix}"
+            else:
+                record.msg = f"{self._prefix}{record.msg}{self._suffix}"
+            record._warning_decorated = True
         return super().format(record)
 
 
@@ -47,6 +56,9 @@ class CliRunner:
     def __init__(self, verbose: bool = False):
         """Initialize CLI runner."""
         self.verbose = verbose
+        # Warnings from the most recent validate_config call (empty for
+        # cached hits, which are only stored for warning-free validations)
+        self.last_validation_warnings: list[str] = []
         self._setup_logging()
 
     def _setup_logging(self) -> None:
@@ -74,51 +86,99 @@ class CliRunner:
 
     def show_options(self) -> None:
         """Display available configuration options."""
+        from .config_docs import format_configuration_docs
+
         click.echo(format_configuration_docs())
 
-    def validate_config(self, config_path: Path) -> tuple[bool, ScreenshotConfig | None]:
-        """Validate configuration file."""
+    def validate_config(self, config_path: Path, use_cache: bool = True) -> tuple[bool, "ScreenshotConfig | None"]:
+        """Validate configuration file, using the parse cache when possible.
+
+        Args:
+            config_path: Path to the configuration file
+            use_cache: Serve warm parse-cache hits. Callers that need the
+                filesystem checks re-run (input images may have moved since
+                the entry was stored) should pass False.
+        """
+        from .parse_cache import load_cached_config, store_cached_config
+        from .validator import ConfigValidator
+
+        if use_cache:
+            cached_config = load_cached_config(config_path)
+            if cached_config is not None:
+                self.last_validation_warnings = []
+                return True, cached_config
+
         validator = ConfigValidator(verbose=self.verbose)
-        return validator.validate_config_file(str(config_path))
+        is_valid, config = validator.validate_config_file(str(config_path))
+        self.last_validation_warnings = list(validator.warnings)
+
+        # Only cache clean validations: cached hits skip the validator, so
+        # entries with warnings would silently suppress them on repeat runs
+        if is_valid and config is not None and not validator.warnings:
+            store_cached_config(config_path, config)
+
+        return is_valid, config
 
     def generate_screenshots(
-        self, config_path: Path, output_dir: Path, language: str | None = None, validate_only: bool = False
+        self,
+        config_path: Path,
+        output_dir: Path,
+        language: str | None = None,
+        validate_only: bool = False,
+        fast: bool = False,
+        jobs: int = 1,
     ) -> int:
         """Generate screenshots from configuration.
 
         Returns:
             Exit code (0 for success, 1 for failure)
         """
-        # Validate configuration
-        is_valid, screenshot_config = self.validate_config(config_path)
+        from .config_manager import ConfigManager
+        from .generator import ScreenshotGenerator
+        from .preset_themes import PresetThemes
+        from .ui_reporter import ConsoleReporter
+
+        # Validate configuration; an explicit --validate-only run must see
+        # the current filesystem state, not a warm cache entry
+        is_valid, screenshot_config = self.validate_config(config_path, use_cache=not validate_only)
 
         if not is_valid or screenshot_config is None:
             return 1
 
         if validate_only:
-            validator = ConfigValidator(verbose=self.verbose)
-            if not validator.warnings:
+            if not self.last_validation_warnings:
                 click.echo("\n✅ Configuration is valid!")
             return 0
 
         logger.debug(f"Loaded configuration from {config_path}")
         logger.debug(f"Found {len(screenshot_config.screenshots)} screenshots to generate")
 
+        # One ConfigManager per run, shared by the summary, the generator
+        # and the results display
+        config_manager = ConfigManager(screenshot_config, PresetThemes())
+
         # Display summary
-        self._display_generation_summary(config_path, screenshot_config, language)
+        self._display_generation_summary(config_path, screenshot_config, language, config_manager)
 
         try:
             # Create generator with appropriate reporter
             ui_reporter = ConsoleReporter(verbose=self.verbose)
             generator = ScreenshotGenerator(
-                screenshot_config, output_dir=output_dir, config_path=config_path, ui_reporter=ui_reporter
+                screenshot_config,
+                output_dir=output_dir,
+                config_path=config_path,
+                ui_reporter=ui_reporter,
+                config_manager=config_manager,
+                compress_level=1 if fast else 6,
             )
 
-            # Generate screenshots
-            generated_files = generator.generate_all(language=language)
+            # Generate screenshots; --jobs 0 means one worker per core
+            if jobs == 0:
+                jobs = os.cpu_count() or 1
+            generated_files = generator.generate_all(language=language, max_workers=jobs if jobs > 1 else None)
 
             # Display results
-            self._display_results(generated_files, output_dir, screenshot_config, language)
+            self._display_results(generated_files, output_dir, language, config_manager)
 
             return 0
 
@@ -132,29 +192,37 @@ class CliRunner:
             click.echo(f"❌ Unexpected error: {e}", err=True)
             return 1
 
-    def _display_generation_summary(self, config_path: Path, config: ScreenshotConfig, language: str | None) -> None:
+    def _display_generation_summary(
+        self, config_path: Path, config: "ScreenshotConfig", language: str | None, config_manager: "ConfigManager"
+    ) -> None:
         """Display generation summary before processing."""
-        click.echo(f"\n📋 Configuration: {config_path.name}")
-        click.echo(f"🖼  Screenshots: {len(config.screenshots)}")
-
         # Get languages and sizes for display
-        config_manager = ConfigManager(config, PresetThemes())
         languages = config_manager.get_languages_to_generate(language)
         sizes = config.output_sizes
         total_count = len(config.screenshots) * len(languages) * len(sizes)
 
-        click.echo(f"🌐 Languages: {', '.join(languages) if languages else 'None'}")
-        click.echo(f"📐 Sizes: {', '.join([f'{w}×{h}' for w, h in sizes])}")
-        click.echo()
-
         if language:
             count = len(config.screenshots) * len(sizes)
-            click.echo(f"📱 Generating {count} screenshots for {language}...")
+            generating_line = f"📱 Generating {count} screenshots for {language}..."
         else:
-            click.echo(f"📱 Generating {total_count} screenshots...")
+            generating_line = f"📱 Generating {total_count} screenshots..."
+
+        # One write for the whole summary block
+        click.echo(
+            "\n".join(
+                [
+                    f"\n📋 Configuration: {config_path.name}",
+                    f"🖼  Screenshots: {len(config.screenshots)}",
+                    f"🌐 Languages: {', '.join(languages) if languages else 'None'}",
+                    f"📐 Sizes: {', '.join([f'{w}×{h}' for w, h in sizes])}",
+                    "",
+                    generating_line,
+                ]
+            )
+        )
 
     def _display_results(
-        self, generated_files: list[Path], output_dir: Path, config: ScreenshotConfig, language: str | None
+        self, generated_files: list[Path], output_dir: Path, language: str | None, config_manager: "ConfigManager"
     ) -> None:
         """Display generation results."""
         click.echo()
@@ -162,13 +230,19 @@ class CliRunner:
         click.echo(f"📁 Output: {output_dir}/")
 
         if self.verbose:
-            # Show detailed file list in verbose mode
-            config_manager = ConfigManager(config, PresetThemes())
-            languages = config_manager.get_languages_to_generate(language)
+            # Show detailed file list in verbose mode, grouped by language
+            # in a single pass over the generated files
+            groups: dict[str, list[Path]] = defaultdict(list)
+            for f in generated_files:
+                try:
+                    # First path component under output_dir is the language
+                    groups[f.relative_to(output_dir).parts[0]].append(f)
+                except ValueError:
+                    continue
 
+            languages = config_manager.get_languages_to_generate(language)
             for lang in languages:
-                lang_files = [f for f in generated_files if f"/{lang}/" in str(f)]
+                lang_files = groups.get(lang, [])
                 if lang_files:
-                    click.echo(f"\n  {lang}:")
-                    for file in lang_files:
-                        click.echo(f"    - {file.parent.name}/{file.name}")
+                    lines = "\n".join(f"    - {f.parent.name}/{f.name}" for f in lang_files)
+                    click.echo(f"\n  {lang}:\n{lines}")
@@ -1,6 +1,7 @@
 """Dynamic configuration documentation generator from Pydantic models."""
 
-from typing import Any, get_args, get_origin
+import functools
+from typing import Any, cast, get_args, get_origin
 
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
@@ -8,6 +9,31 @@ from pydantic_core import PydanticUndefined
 from .models import ImageStyle, Screenshot, ScreenshotConfig, TextStyle
 
 
+def _format_list(args: tuple[Any, ...]) -> str:
+    return f"list[{get_type_string(args[0])}]" if args else "list"
+
+
+def _format_dict(args: tuple[Any, ...]) -> str:
+    if len(args) == 2:
+        return f"dict[{get_type_string(args[0])}, {get_type_string(args[1])}]"
+    return "dict"
+
+
+def _format_tuple(args: tuple[Any, ...]) -> str:
+    if args:
+        return f"tuple[{', '.join(get_type_string(arg) for arg in args)}]"
+    return "tuple"
+
+
+# Static dispatch for the container origins that recur across the models
+_ORIGIN_FORMATTERS = {
+    list: _format_list,
+    dict: _format_dict,
+    tuple: _format_tuple,
+}
+
+
+@functools.cache
 def get_type_string(type_hint: Any) -> str:
     """Convert Python type hint to readable string."""
     origin = get_origin(type_hint)
@@ -17,23 +43,9 @@ def get_type_string(type_hint: Any) -> str:
             return str(type_hint.__name__)
         return str(type_hint)
 
-    if origin is list or origin is list:
-        args = get_args(type_hint)
-        if args:
-            return f"list[{get_type_string(args[0])}]"
-        return "list"
-
-    if origin is dict or origin is dict:
-        args = get_args(type_hint)
-        if len(args) == 2:
-            return f"dict[{get_type_string(args[0])}, {get_type_string(args[1])}]"
-        return "dict"
-
-    if origin is tuple:
-        args = get_args(type_hint)
-        if args:
-            return f"tuple[{', '.join(get_type_string(arg) for arg in args)}]"
-        return "tuple"
+    formatter = _ORIGIN_FORMATTERS.get(origin)
+    if formatter is not None:
+        return formatter(get_args(type_hint))
 
     # Handle Optional/Union types
     args = get_args(type_hint)
@@ -69,14 +81,21 @@ def extract_field_info(model: type[BaseModel], field_name: str) -> tuple[str, An
     # Get description
     description = field_info.description or ""
 
-    # Get type string
-    type_str = get_type_string(field_type)
+    # Get type string; annotation is only None for unannotated fields,
+    # which these models never have, and the cache wrapper insists on a
+    # Hashable argument that type[Any] does not satisfy
+    type_str = get_type_string(cast(Any, field_type)) if field_type is not None else "None"
 
     return type_str, default, is_required, description
 
 
+@functools.cache
 def format_configuration_docs() -> str:
-    """Generate and format configuration documentation dynamically."""
+    """Generate and format configuration documentation dynamically.
+
+    The output depends only on the installed models, so it is computed once
+    and memoized for repeated --show-options calls.
+    """
     output: list[str] = []
 
     output.append("=" * 80)
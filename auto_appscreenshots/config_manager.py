@@ -1,7 +1,7 @@
 """Configuration management following Single Responsibility and Dependency Inversion principles."""
 
 from .models import ImageStyle, Screenshot, ScreenshotConfig, TextStyle, Theme
-from .preset_themes import PresetThemes
+from .preset_themes import TEXT_LAYOUTS, PresetThemes
 from .style_merger import StyleMerger
 
 
@@ -14,50 +14,70 @@ class ConfigManager:
         self.theme_validator = theme_validator or PresetThemes()
         self.style_merger = StyleMerger()
 
+        # Derivations reused across the generation loop: language extraction
+        # and theme validation are per-config facts, not per-screenshot work
+        seen: dict[str, None] = {}
+        for s in config.screenshots:
+            seen.update(dict.fromkeys(s.text.main_text.keys()))
+        # Explicit config.languages keeps its own order; the derived fallback
+        # is sorted for deterministic output (near-free when already ordered)
+        self._all_languages = sorted(seen)
+        self._theme_cache: dict[str, Theme] = {}
+        # Merged text styles are deterministic per (theme, screenshot,
+        # language, type); screenshots without their own style share the
+        # theme-level entry
+        self._text_style_cache: dict[tuple[str, str, str, int | None], TextStyle] = {}
+
     def get_languages_to_generate(self, specific_language: str | None = None) -> list[str]:
         """Get list of languages to generate."""
         if specific_language:
             return [specific_language]
         elif self.config.languages:
             return self.config.languages
+        elif self._all_languages:
+            return self._all_languages
         else:
-            # Extract all unique languages from screenshots
-            all_languages: set[str] = set()
-            for screenshot in self.config.screenshots:
-                all_languages.update(screenshot.text.main_text.keys())
-            if all_languages:
-                return sorted(all_languages)
-            else:
-                raise ValueError("No languages defined in configuration")
+            raise ValueError("No languages defined in configuration")
 
     def get_theme_style(self, screenshot: Screenshot) -> Theme:
         """Get theme style configuration for a screenshot."""
         theme_name = screenshot.theme or self.config.default_theme
 
-        # Validate preset theme
+        cached = self._theme_cache.get(theme_name)
+        if cached is not None:
+            return cached
+
+        # Validate preset theme (at most once per theme name)
         if not PresetThemes.is_valid_theme(theme_name):
             raise ValueError(f"Invalid preset theme: {theme_name}. Available: {PresetThemes.list_themes()}")
 
-        # Get theme-specific style if exists
-        theme_style = self.config.theme_styles.get(theme_name)
-
-        # Return theme style or empty theme
-        return theme_style or Theme(
+        # Get theme-specific style if exists, falling back to an empty theme
+        theme_style = self.config.theme_styles.get(theme_name) or Theme(
             text_area_height=None,
             background_color=None,
             image_style=None,
             main_text_style=None,
             sub_text_style=None,
         )
+        self._theme_cache[theme_name] = theme_style
+        return theme_style
 
     def _get_text_style(self, screenshot: Screenshot, language: str, style_type: str) -> TextStyle:
         """Generic method to get text style for a screenshot."""
         theme_style = self.get_theme_style(screenshot)
+        theme_name = screenshot.theme or self.config.default_theme
 
         # Get theme style and screenshot style based on type
         theme_localized_style = getattr(theme_style, f"{style_type}_text_style", None)
         screenshot_localized_style = getattr(screenshot, f"{style_type}_text_style", None)
 
+        # Screenshots without their own style resolve purely from the theme
+        # and can share one cache entry per (theme, language, type)
+        key = (theme_name, language, style_type, id(screenshot) if screenshot_localized_style else None)
+        cached = self._text_style_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Get default language for fallback
         default_language = self.config.default_language
 
@@ -73,9 +93,12 @@ class ConfigManager:
             screenshot_style = self.style_merger.get_style_for_language(
                 screenshot_localized_style, language, default_language
             )
-            return self.style_merger.merge_text_styles(theme_text_style, screenshot_style)
+            merged = self.style_merger.merge_text_styles(theme_text_style, screenshot_style)
+        else:
+            merged = theme_text_style
 
-        return theme_text_style
+        self._text_style_cache[key] = merged
+        return merged
 
     def get_main_text_style(self, screenshot: Screenshot, language: str) -> TextStyle:
         """Get main text style for a screenshot."""
@@ -103,4 +126,5 @@ class ConfigManager:
     def get_text_layout(self, screenshot: Screenshot) -> str:
         """Get text layout mode for a screenshot (determined by preset theme)."""
         theme_name = screenshot.theme or self.config.default_theme
-        return PresetThemes.get_text_layout(theme_name)
+        # Theme names are validated by get_theme_style before rendering
+        return TEXT_LAYOUTS[theme_name]
@@ -1,6 +1,9 @@
 """File management utilities following Single Responsibility Principle."""
 
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from PIL import Image
@@ -9,20 +12,34 @@ from .models import Screenshot
 
 logger = logging.getLogger(__name__)
 
+# Placeholders supported in output_name templates
+_PLACEHOLDER_RE = re.compile(r"\{(lang|size|width|height)\}")
+
 
 class FileManager:
     """Handles file operations and path management."""
 
-    def __init__(self, base_output_dir: Path, config_dir: Path | None = None):
+    def __init__(self, base_output_dir: Path, config_dir: Path | None = None, compress_level: int = 6):
         """Initialize file manager with base output directory.
 
         Args:
             base_output_dir: Base directory for output files
             config_dir: Directory containing the config file (for resolving relative paths)
+            compress_level: PNG zlib compression level (0-9); lower is faster
         """
         self.base_output_dir = base_output_dir
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
         self.config_dir = config_dir or Path.cwd()
+        self.compress_level = compress_level
+        # Directories known to exist; avoids a mkdir syscall per output file
+        self._created_dirs: set[Path] = set()
+        # Input path resolution/existence caches keyed by the raw string;
+        # the same inputs are checked per language and per size
+        self._resolved: dict[str, Path] = {}
+        self._exists: dict[str, bool] = {}
+        # Output directories registered by prepare_directories, so
+        # get_output_directories can skip re-walking the tree
+        self._output_dirs: list[Path] = []
 
     def create_output_path(
         self,
@@ -56,36 +73,89 @@ class FileManager:
         # Build full path with language and resolution directories
         output_path = self.base_output_dir / language / resolution_str / output_filename
 
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (once per unique directory)
+        parent = output_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
 
         return output_path
 
-    def save_image(self, image: Image.Image, path: Path, quality: int = 95) -> None:
+    def prepare_directories(self, languages: list[str], sizes: list[tuple[int, int]]) -> None:
+        """Create all output directories for a generation run in one pass.
+
+        Args:
+            languages: Language codes that will be generated
+            sizes: Output sizes as (width, height) tuples
+        """
+        for language in languages:
+            for width, height in sizes:
+                directory = self.base_output_dir / language / f"{width}x{height}"
+                if directory not in self._created_dirs:
+                    directory.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(directory)
+                if directory not in self._output_dirs:
+                    self._output_dirs.append(directory)
+
+    def save_image(self, image: Image.Image, path: Path, quality: int = 95, compress_level: int | None = None) -> None:
         """Save image to specified path.
 
         Args:
             image: PIL Image to save
             path: Output path
-            quality: JPEG/PNG compression quality (0-100)
+            quality: JPEG compression quality (0-100)
+            compress_level: PNG zlib compression level (0-9); defaults to the
+                manager-wide setting
         """
         try:
             # Convert RGBA to RGB to remove alpha channel
             if image.mode == "RGBA":
-                # Create RGB image with white background
-                rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                rgb_image.paste(image, mask=image.split()[3])  # Use alpha channel as mask
-                image = rgb_image
+                alpha_min, alpha_max = image.getchannel("A").getextrema()
+                if (alpha_min, alpha_max) == (255, 255):
+                    # Fully opaque: just drop the alpha channel, no composite
+                    image = image.convert("RGB")
+                else:
+                    # Create RGB image with white background
+                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+                    rgb_image.paste(image, mask=image.split()[3])  # Use alpha channel as mask
+                    image = rgb_image
             elif image.mode != "RGB":
                 # Convert other modes to RGB
                 image = image.convert("RGB")
 
-            image.save(path, quality=quality)
+            if path.suffix.lower() in (".jpg", ".jpeg"):
+                image.save(path, quality=quality)
+            else:
+                # PNG ignores quality; DEFLATE level dominates encode time
+                if compress_level is None:
+                    compress_level = self.compress_level
+                image.save(path, format="PNG", compress_level=compress_level, optimize=False)
             logger.debug(f"Saved image to: {path}")
         except Exception as e:
             logger.error(f"Failed to save image to {path}: {e}")
             raise
 
+    def save_images_batch(self, items: list[tuple[Image.Image, Path]], quality: int = 95) -> None:
+        """Save multiple images concurrently.
+
+        PNG encoding in Pillow releases the GIL inside libpng, so encoding
+        and writing a batch overlaps well across threads.
+
+        Args:
+            items: List of (image, output path) pairs to save
+            quality: JPEG/PNG compression quality (0-100)
+        """
+        if len(items) <= 1:
+            for image, path in items:
+                self.save_image(image, path, quality)
+            return
+
+        max_workers = min(len(items), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.save_image, image, path, quality) for image, path in items]
+            for future in as_completed(futures):
+                future.result()
+
     def check_input_exists(self, path: str) -> bool:
         """Check if input file exists.
 
@@ -95,10 +165,11 @@ class FileManager:
         Returns:
             True if file exists, False otherwise
         """
-        input_path = Path(path)
-        if not input_path.is_absolute():
-            input_path = self.config_dir / input_path
-        return input_path.exists()
+        exists = self._exists.get(path)
+        if exists is None:
+            exists = self.resolve_input_path(path).exists()
+            self._exists[path] = exists
+        return exists
 
     def get_output_directories(self) -> list[Path]:
         """Get list of output directories created.
@@ -106,6 +177,9 @@ class FileManager:
         Returns:
             List of Path objects for each output directory
         """
+        if self._output_dirs:
+            return list(self._output_dirs)
+        # Fall back to walking the tree when prepare_directories wasn't used
         return list(self.base_output_dir.glob("*/*/"))
 
     def _process_output_name(self, output_name: str, language: str, width: int, height: int) -> str:
@@ -120,17 +194,14 @@ class FileManager:
         Returns:
             Processed filename with .png extension
         """
-        # Replace placeholders
-        processed = output_name
-
-        if "{lang}" in processed:
-            processed = processed.replace("{lang}", language)
-        if "{size}" in processed:
-            processed = processed.replace("{size}", f"{width}x{height}")
-        if "{width}" in processed:
-            processed = processed.replace("{width}", str(width))
-        if "{height}" in processed:
-            processed = processed.replace("{height}", str(height))
+        # Replace all placeholders in a single scan
+        replacements = {
+            "lang": language,
+            "size": f"{width}x{height}",
+            "width": str(width),
+            "height": str(height),
+        }
+        processed = _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], output_name)
 
         # Ensure .png extension
         if not processed.endswith(".png"):
@@ -170,7 +241,10 @@ class FileManager:
         Returns:
             Resolved absolute path
         """
-        input_path = Path(path)
-        if not input_path.is_absolute():
-            input_path = self.config_dir / input_path
-        return input_path
+        resolved = self._resolved.get(path)
+        if resolved is None:
+            resolved = Path(path)
+            if not resolved.is_absolute():
+                resolved = self.config_dir / resolved
+            self._resolved[path] = resolved
+        return resolved
@@ -1,9 +1,14 @@
 """Weight-based font finder using standard OpenType weight values."""
 
+import hashlib
 import logging
 import os
+import pickle
+import struct
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from PIL import ImageFont
 
 logger = logging.getLogger(__name__)
@@ -34,6 +39,17 @@ class FontFinder:
     # Cache for TTC font mappings: font_path -> (weight, style) -> index
     _ttc_cache: dict[str, dict[tuple[int, str], int]] = {}
 
+    # Packed companion structure for subfont lookup: font_path ->
+    # (int-keyed exact-match dict, weights, style codes, subfont indices).
+    # The persisted mapping in _ttc_cache stays tuple-keyed; this is a
+    # per-process structure-of-arrays view of it.
+    _ttc_cache_np: dict[str, tuple[dict[int, int], np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    _STYLE_CODES = {"normal": 0, "italic": 1, "oblique": 2}
+
+    # One-time index of installed fonts: lowercased family name -> entries
+    _font_index: dict[str, list[Any]] | None = None
+
     @classmethod
     def load_font(
         cls, font_name: str, size: int, weight: str | None = None, style: str = "normal"
@@ -52,6 +68,13 @@ class FontFinder:
         # Convert weight to numeric value
         weight_value = cls._get_weight_value(weight)
 
+        # Direct file paths skip font discovery — and with it the expensive
+        # matplotlib.font_manager import — entirely
+        if os.path.isfile(font_name):
+            if font_name.lower().endswith(".ttc"):
+                return cls._load_ttc_font(font_name, size, weight_value, style)
+            return cls._load_regular_font(font_name, size, weight_value)
+
         # Find font file
         font_path = cls._find_font_file(font_name, weight_value)
         if not font_path:
@@ -75,25 +98,40 @@ class FontFinder:
 
         return cls.WEIGHT_MAP.get(weight.lower(), 400)
 
+    @classmethod
+    def _get_font_index(cls) -> dict[str, list[Any]]:
+        """Build (once) and return the installed-font index by family name.
+
+        Scanning matplotlib's ttflist per lookup is O(installed fonts);
+        grouping the list into a dict makes every later lookup O(1).
+        """
+        if cls._font_index is None:
+            import matplotlib.font_manager as fm
+
+            index: dict[str, list[Any]] = {}
+            for font in fm.fontManager.ttflist:
+                index.setdefault(font.name.lower(), []).append(font)
+            cls._font_index = index
+        return cls._font_index
+
     @classmethod
     def _find_font_file(cls, font_name: str, weight_value: int | None = None) -> str | None:
         """Find font file by name using matplotlib, considering weight for multiple matches."""
         try:
-            # Try matplotlib's findfont
             import matplotlib.font_manager as fm
 
             # Find all fonts with matching name
-            matching_fonts = [font for font in fm.fontManager.ttflist if font.name.lower() == font_name.lower()]
+            matching_fonts = cls._get_font_index().get(font_name.lower())
 
             if matching_fonts:
                 # If weight specified, find the closest match
                 if weight_value is not None:
                     best_font = min(matching_fonts, key=lambda f: abs(int(f.weight) - weight_value))
                     logger.debug(f"Selected font with weight {best_font.weight} (target: {weight_value})")
-                    return best_font.fname
+                    return str(best_font.fname)
                 else:
                     # Return the first match if no weight specified
-                    return matching_fonts[0].fname
+                    return str(matching_fonts[0].fname)
 
             # Fallback to matplotlib's default search
             font_prop = fm.FontProperties(family=font_name)
@@ -121,7 +159,7 @@ class FontFinder:
             # Fallback to first font if cache building failed
             return cls._load_font_at_index(font_path, size, 0)
 
-        best_index = cls._find_best_match(cache, weight_value, style)
+        best_index = cls._find_best_match(font_path, weight_value, style)
         return cls._load_font_at_index(font_path, size, best_index)
 
     @classmethod
@@ -154,24 +192,80 @@ class FontFinder:
             logger.error(f"Failed to load font at index {index}: {e}")
             return None
 
+    @classmethod
+    def _read_ttc_font_count(cls, font_path: str) -> int:
+        """Read the number of subfonts from the TTC header."""
+        with open(font_path, "rb") as f:
+            tag, _version, num_fonts = struct.unpack(">4sLL", f.read(12))
+        if tag != b"ttcf":
+            raise ValueError(f"Not a TTC file: {font_path}")
+        return int(num_fonts)
+
+    @classmethod
+    def _ttc_disk_cache_path(cls, font_path: str) -> Path:
+        """Cache file for a TTC's weight/style mapping."""
+        from .parse_cache import get_cache_dir
+
+        key = hashlib.sha256(font_path.encode("utf-8")).hexdigest()[:16]
+        return get_cache_dir() / f"ttc_{key}.pkl"
+
+    @classmethod
+    def _load_ttc_cache_from_disk(cls, font_path: str) -> dict[tuple[int, str], int] | None:
+        """Load a persisted TTC mapping if it is newer than the font file."""
+        try:
+            cache_file = cls._ttc_disk_cache_path(font_path)
+            if cache_file.exists() and cache_file.stat().st_mtime >= os.path.getmtime(font_path):
+                with open(cache_file, "rb") as f:
+                    entry = pickle.load(f)
+                if isinstance(entry, dict):
+                    return entry
+        except Exception as e:
+            logger.debug(f"Failed to load TTC cache for {font_path}: {e}")
+        return None
+
+    @classmethod
+    def _store_ttc_cache_to_disk(cls, font_path: str, mapping: dict[tuple[int, str], int]) -> None:
+        """Persist a TTC mapping so future processes skip the parse."""
+        try:
+            cache_file = cls._ttc_disk_cache_path(font_path)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(mapping, f)
+        except Exception as e:
+            logger.debug(f"Failed to write TTC cache for {font_path}: {e}")
+
     @classmethod
     def _build_ttc_cache(cls, font_path: str) -> None:
-        """Build weight/style mapping for TTC file."""
+        """Build weight/style mapping for TTC file.
+
+        Subfonts are opened lazily so only the OS/2 and name tables are
+        parsed — the glyph data that makes up most of the file is skipped.
+        The result is persisted to disk with mtime invalidation, so each
+        process after the first loads the mapping instead of re-parsing.
+        """
+        cached = cls._load_ttc_cache_from_disk(font_path)
+        if cached is not None:
+            cls._ttc_cache[font_path] = cached
+            return
+
         try:
-            from fontTools.ttLib import TTCollection  # type: ignore[import-untyped, unused-ignore]
+            from fontTools.ttLib import TTFont  # type: ignore[import-untyped, unused-ignore]
 
             cls._ttc_cache[font_path] = {}
-            ttc = TTCollection(font_path)
 
-            for index, ttfont in enumerate(ttc):  # type: ignore[var-annotated, unused-ignore]
-                weight = cls._get_font_weight(ttfont)  # type: ignore[arg-type, unused-ignore]
-                style = cls._get_font_style(ttfont)  # type: ignore[arg-type, unused-ignore]
+            for index in range(cls._read_ttc_font_count(font_path)):
+                ttfont = TTFont(font_path, fontNumber=index, lazy=True)
+                weight = cls._get_font_weight(ttfont)
+                style = cls._get_font_style(ttfont)
+                ttfont.close()
 
                 # Store mapping: (weight, style) -> index
                 key = (weight, style)
                 cls._ttc_cache[font_path][key] = index
 
                 logger.debug(f"TTC {os.path.basename(font_path)} [{index}]: weight={weight}, style={style}")
+
+            cls._store_ttc_cache_to_disk(font_path, cls._ttc_cache[font_path])
         except ImportError:
             logger.warning("fontTools not installed. TTC weight selection may not work correctly.")
             # Fallback: create simple mapping for common cases
@@ -211,30 +305,42 @@ class FontFinder:
         return "normal"
 
     @classmethod
-    def _find_best_match(cls, cache: dict[tuple[int, str], int], target_weight: int, target_style: str) -> int:
-        """Find best matching font index from cache."""
+    def _get_packed_cache(cls, font_path: str) -> tuple[dict[int, int], np.ndarray, np.ndarray, np.ndarray]:
+        """Build (once) the packed lookup structure for a TTC mapping.
+
+        The exact-match dict keys on `weight * 16 + style_code`, a single
+        int, so hits avoid tuple hashing; the parallel arrays back the
+        vectorized nearest-weight scan.
+        """
+        packed = cls._ttc_cache_np.get(font_path)
+        if packed is None:
+            entries = cls._ttc_cache[font_path]
+            exact = {weight * 16 + cls._STYLE_CODES.get(style, 0): index for (weight, style), index in entries.items()}
+            weights = np.fromiter((weight for weight, _ in entries), dtype=np.int32, count=len(entries))
+            styles = np.fromiter(
+                (cls._STYLE_CODES.get(style, 0) for _, style in entries), dtype=np.int32, count=len(entries)
+            )
+            indices = np.fromiter(entries.values(), dtype=np.int32, count=len(entries))
+            packed = (exact, weights, styles, indices)
+            cls._ttc_cache_np[font_path] = packed
+        return packed
+
+    @classmethod
+    def _find_best_match(cls, font_path: str, target_weight: int, target_style: str) -> int:
+        """Find best matching font index from the packed TTC cache."""
+        exact, weights, styles, indices = cls._get_packed_cache(font_path)
+        style_code = cls._STYLE_CODES.get(target_style, 0)
+
         # Try exact match
-        key = (target_weight, target_style)
-        if key in cache:
-            return cache[key]
-
-        # Find closest weight with matching style
-        best_index = 0
-        min_diff = float("inf")
-
-        for (weight, style), index in cache.items():
-            if style == target_style:
-                diff = abs(weight - target_weight)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_index = index
-
-        # If no style match found, find closest weight ignoring style
-        if min_diff == float("inf"):
-            for (weight, _), index in cache.items():
-                diff = abs(weight - target_weight)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_index = index
-
-        return best_index
+        index = exact.get(target_weight * 16 + style_code)
+        if index is not None:
+            return index
+
+        # Closest weight among subfonts with a matching style; if the style
+        # is absent, closest weight over all subfonts
+        mask = styles == style_code
+        if not mask.any():
+            mask = np.ones_like(mask)
+        candidates = weights[mask]
+        best = int(np.abs(candidates - target_weight).argmin())
+        return int(indices[mask][best])
@@ -1,8 +1,11 @@
 """Screenshot generator with text overlay functionality."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from .config_manager import ConfigManager
@@ -11,11 +14,39 @@ from .image_processor import ImageProcessor
 from .models import Screenshot, ScreenshotConfig
 from .preset_themes import PresetThemes
 from .text_renderer import TextPosition, TextRenderer
-from .ui_reporter import ConsoleReporter, UIReporter
+from .ui_reporter import BatchReporter, ConsoleReporter, UIReporter
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _RenderTask:
+    """One (language, screenshot) unit of work for the process pool."""
+
+    config: ScreenshotConfig
+    output_dir: Path
+    config_path: Path | None
+    screenshot_index: int
+    language: str
+    compress_level: int
+
+
+def _run_render_task(task: _RenderTask) -> list[Path]:
+    """Execute a render task in a worker process.
+
+    Each worker builds its own generator; per-process caches (fonts, masks,
+    merged styles) warm up once per worker and are reused across tasks.
+    """
+    generator = ScreenshotGenerator(
+        task.config,
+        output_dir=task.output_dir,
+        config_path=task.config_path,
+        compress_level=task.compress_level,
+    )
+    screenshot = task.config.screenshots[task.screenshot_index]
+    return generator.generate_screenshot(screenshot, index=task.screenshot_index + 1, language=task.language)
+
+
 class ScreenshotGenerator:
     """Generate App Store Connect screenshots with text overlays."""
 
@@ -25,6 +56,8 @@ class ScreenshotGenerator:
         output_dir: Path,
         config_path: Path | None = None,
         ui_reporter: UIReporter | None = None,
+        config_manager: ConfigManager | None = None,
+        compress_level: int = 6,
     ):
         """Initialize generator with configuration.
 
@@ -33,20 +66,40 @@ class ScreenshotGenerator:
             output_dir: Output directory path
             config_path: Path to the config file (for resolving relative paths)
             ui_reporter: UI reporter for progress updates
+            config_manager: Existing ConfigManager to reuse (constructed if omitted)
+            compress_level: PNG zlib compression level (0-9); lower is faster
         """
         self.config = config
-        self.config_manager = ConfigManager(config, PresetThemes())
+        self.config_path = config_path
+        self.config_manager = config_manager or ConfigManager(config, PresetThemes())
         config_dir = config_path.parent if config_path else Path.cwd()
-        self.file_manager = FileManager(output_dir, config_dir=config_dir)
+        self.file_manager = FileManager(output_dir, config_dir=config_dir, compress_level=compress_level)
         self.image_processor = ImageProcessor()
         self.text_renderer = TextRenderer()
         self.ui_reporter = ui_reporter or ConsoleReporter()
+        # Canvas buffers pooled by size; each output size allocates its
+        # ~15 MB RGBA buffer once per run instead of once per screenshot
+        self._canvas_pool: dict[tuple[int, int], np.ndarray] = {}
+
+    def generate_all(self, language: str | None = None, max_workers: int | None = None) -> list[Path]:
+        """Generate all screenshots defined in configuration.
 
-    def generate_all(self, language: str | None = None) -> list[Path]:
-        """Generate all screenshots defined in configuration."""
+        Args:
+            language: Specific language to generate (all when None)
+            max_workers: Number of worker processes; None or 1 runs in-process
+
+        Returns:
+            List of generated file paths
+        """
         generated_files: list[Path] = []
         languages = self.config_manager.get_languages_to_generate(language)
 
+        # Create every output directory up front instead of per file
+        self.file_manager.prepare_directories(languages, self.config.output_sizes)
+
+        if max_workers is not None and max_workers > 1:
+            return self._generate_all_parallel(languages, max_workers)
+
         for lang in languages:
             logger.debug(f"Generating screenshots for language: {lang}")
             self.ui_reporter.report_language_start(lang)
@@ -70,6 +123,60 @@ class ScreenshotGenerator:
 
         return generated_files
 
+    def _generate_all_parallel(self, languages: list[str], max_workers: int) -> list[Path]:
+        """Generate all (language, screenshot) combinations on a process pool.
+
+        Outputs share no mutable state, so tasks run independently; results
+        are re-assembled in the serial language/screenshot order.
+        """
+        tasks = [
+            _RenderTask(
+                config=self.config,
+                output_dir=self.file_manager.base_output_dir,
+                config_path=self.config_path,
+                screenshot_index=i,
+                language=lang,
+                compress_level=self.file_manager.compress_level,
+            )
+            for lang in languages
+            for i in range(len(self.config.screenshots))
+        ]
+        task_order = {id(task): order for order, task in enumerate(tasks)}
+        results: dict[int, list[Path]] = {}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_run_render_task, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    output_paths = future.result()
+                except Exception as e:
+                    self.ui_reporter.report_screenshot_error(e)
+                    logger.error(
+                        f"Failed to generate screenshot {task.screenshot_index + 1} for language {task.language}: {e}"
+                    )
+                    raise
+
+                results[task_order[id(task)]] = output_paths
+
+        # Tasks finish out of order; replay progress in submission order so
+        # the report matches what the serial path would print
+        batch = BatchReporter()
+        total = len(self.config.screenshots)
+        current_language: str | None = None
+        generated_files: list[Path] = []
+        for order, task in enumerate(tasks):
+            if task.language != current_language:
+                batch.report_language_start(task.language)
+                current_language = task.language
+            output_paths = results[order]
+            name = Path(task.config.screenshots[task.screenshot_index].input_image).stem
+            batch.report_screenshot_start(task.screenshot_index + 1, total, name)
+            batch.report_screenshot_success(output_paths)
+            generated_files.extend(output_paths)
+        batch.flush(self.ui_reporter)
+        return generated_files
+
     def generate_screenshot(self, screenshot: Screenshot, index: int | None = None, language: str = "en") -> list[Path]:
         """Generate screenshots with text header in multiple sizes."""
 
@@ -81,8 +188,9 @@ class ScreenshotGenerator:
             logger.error(f"Failed to get text for language {language}: {e}")
             raise
 
-        # Generate for each size
-        generated_paths: list[Path] = []
+        # Generate for each size, deferring the PNG encode so all sizes of
+        # this screenshot are saved concurrently
+        pending_saves: list[tuple[Image.Image, Path]] = []
         for size_width, size_height in self.config.output_sizes:
             # Format input image path with placeholders
             size = (size_width, size_height)
@@ -94,13 +202,15 @@ class ScreenshotGenerator:
 
             # Load original screenshot
             resolved_path = self.file_manager.resolve_input_path(input_image_path)
-            original = self.image_processor.load_image(str(resolved_path))
+            # The screenshot fits inside the canvas, so the canvas size is a
+            # safe decode-scale hint for JPEG sources
+            original = self.image_processor.load_image(str(resolved_path), target_size=size)
             orig_width, orig_height = original.size
             logger.debug(
                 f"Loaded image: {orig_width}x{orig_height} from {input_image_path} for size {size_width}x{size_height}"
             )
 
-            generated_path = self._generate_single_size(
+            canvas, generated_path = self._generate_single_size(
                 screenshot=screenshot,
                 original=original,
                 main_text=main_text,
@@ -110,9 +220,11 @@ class ScreenshotGenerator:
                 index=index,
                 language=language,
             )
-            generated_paths.append(generated_path)
+            pending_saves.append((canvas, generated_path))
+
+        self.file_manager.save_images_batch(pending_saves)
 
-        return generated_paths
+        return [path for _, path in pending_saves]
 
     def _generate_single_size(
         self,
@@ -124,8 +236,13 @@ class ScreenshotGenerator:
         canvas_height: int,
         index: int | None = None,
         language: str = "en",
-    ) -> Path:
-        """Generate a single screenshot at a specific size."""
+    ) -> tuple[Image.Image, Path]:
+        """Generate a single screenshot at a specific size.
+
+        Returns:
+            Tuple of (composed canvas, output path); saving is left to the
+            caller so a batch of sizes can be encoded concurrently.
+        """
         # Get style configuration
         text_area_height = self.config_manager.get_text_area_height(screenshot)
         background_color = self.config_manager.get_background_color(screenshot)
@@ -159,20 +276,24 @@ class ScreenshotGenerator:
             )
 
         background_color_parsed = self.image_processor.parse_color(background_color)
-        canvas = self.image_processor.create_canvas(canvas_width, canvas_height, background_color_parsed)
 
-        # Compose screenshot onto canvas
-        canvas = self.image_processor.compose_images(canvas, screenshot_resized, x_pos, y_pos)
+        # Fill background and compose screenshot in a single pooled buffer;
+        # the buffer is free for reuse once this screenshot's batch is saved
+        buffer = self._canvas_pool.get((canvas_width, canvas_height))
+        if buffer is None:
+            buffer = np.empty((canvas_height, canvas_width, 4), dtype=np.uint8)
+            self._canvas_pool[(canvas_width, canvas_height)] = buffer
+        canvas = self.image_processor.compose_on_background(
+            canvas_width, canvas_height, background_color_parsed, screenshot_resized, x_pos, y_pos, out=buffer
+        )
         draw = ImageDraw.Draw(canvas)
 
         # Render text on canvas
         self._render_texts(draw, screenshot, main_text, sub_text, canvas_width, text_area_height, language)
 
-        # Save image
         output_path = self.file_manager.create_output_path(language, canvas_width, canvas_height, screenshot, index)
-        self.file_manager.save_image(canvas, output_path)
 
-        return output_path
+        return canvas, output_path
 
     def _render_texts(
         self,
@@ -1,8 +1,27 @@
 """Data models for screenshot configuration."""
 
-from typing import Any
+import re
+from functools import cached_property
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Single-pass input path placeholder substitution
+_INPUT_PLACEHOLDER_RE = re.compile(r"\{(lang|size|width|height)\}")
+
+
+def _expand_to_four(value: int | list[int]) -> tuple[int, int, int, int]:
+    """Expand a CSS-style shorthand (int or 1-4 element list) to four values."""
+    if isinstance(value, int):
+        return (value, value, value, value)
+    if len(value) == 2:
+        return (value[0], value[1], value[0], value[1])
+    if len(value) == 3:
+        return (value[0], value[1], value[2], value[1])
+    if len(value) == 4:
+        return (value[0], value[1], value[2], value[3])
+    # Invalid length, use first value for all or 0
+    fallback = value[0] if value else 0
+    return (fallback, fallback, fallback, fallback)
 
 
 class TextStyleProperty(BaseModel):
@@ -44,32 +63,9 @@ class LocalizedTextStyle(BaseModel):
     )
     shadow_blur: int | dict[str, int] | None = Field(default=None, description="Shadow blur radius in pixels")
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_properties(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Validate property structure."""
-        # Check if this is old format (has language codes like 'ja', 'en' at top level)
-        known_properties = {
-            "font_family",
-            "font_style",
-            "font_weight",
-            "font_size",
-            "color",
-            "offset",
-            "shadow",
-            "shadow_color",
-            "shadow_offset",
-            "shadow_blur",
-        }
-        top_level_keys = set(values.keys())
-
-        # If we have language codes at top level (not known properties)
-        if top_level_keys - known_properties:
-            # This is old format, do NOT convert
-            # Return as is and handle in get_style_for_language
-            pass
-
-        return values
+    # Note: old-format styles (language codes at the top level instead of
+    # under each property) intentionally pass through unconverted and are
+    # handled in get_style_for_language.
 
 
 class TextStyle(BaseModel):
@@ -86,6 +82,20 @@ class TextStyle(BaseModel):
     shadow_offset: tuple[int, int] = Field(default=(2, 2), description="Shadow offset position (x, y) in pixels")
     shadow_blur: int = Field(default=4, description="Shadow blur radius in pixels")
 
+    @cached_property
+    def color_rgba(self) -> tuple[int, int, int, int]:
+        """Text color parsed to RGBA, computed once per instance."""
+        from .image_processor import parse_color
+
+        return parse_color(self.color)
+
+    @cached_property
+    def shadow_color_rgba(self) -> tuple[int, int, int, int]:
+        """Shadow color parsed to RGBA, computed once per instance."""
+        from .image_processor import parse_color
+
+        return parse_color(self.shadow_color)
+
 
 class LocalizedTextContent(BaseModel):
     """Text content with language-specific values.
@@ -124,21 +134,32 @@ class Screenshot(BaseModel):
     main_text_style: LocalizedTextStyle | None = None
     sub_text_style: LocalizedTextStyle | None = None
 
+    # Formatted input paths memoized per (language, size); the combinations
+    # per screenshot are few and fixed, but requested for every render
+    _input_image_cache: dict[tuple[str, tuple[int, int] | None], str] = PrivateAttr(default_factory=dict)
+    # Resolved (main, sub) text pairs memoized per language
+    _text_cache: dict[str, tuple[str, str | None]] = PrivateAttr(default_factory=dict)
+
+    @cached_property
+    def input_image_placeholders(self) -> frozenset[str]:
+        """Placeholder names used by the input image template."""
+        return frozenset(_INPUT_PLACEHOLDER_RE.findall(self.input_image))
+
     def get_text_for_language(self, language: str) -> tuple[str, str | None]:
         """Get main and sub text for the specified language."""
-        main_text = None
-        sub_text = None
+        cached = self._text_cache.get(language)
+        if cached is not None:
+            return cached
 
         # Get main text
-        if language in self.text.main_text:
-            main_text = self.text.main_text[language]
-        else:
+        main_text = self.text.main_text.get(language)
+        if main_text is None:
             raise ValueError(f"No main_text defined for language '{language}' in screenshot")
 
         # Get optional sub text
-        if self.text.sub_text and language in self.text.sub_text:
-            sub_text = self.text.sub_text[language]
+        sub_text = self.text.sub_text.get(language) if self.text.sub_text else None
 
+        self._text_cache[language] = (main_text, sub_text)
         return main_text, sub_text
 
     def format_input_image(
@@ -155,6 +176,15 @@ class Screenshot(BaseModel):
         Returns:
             Formatted path to the input image
         """
+        # No placeholders: the template is already the path
+        if "{" not in self.input_image:
+            return self.input_image
+
+        key = (language, size)
+        cached = self._input_image_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Build replacement dictionary
         replacements = {
             "lang": language,
@@ -165,11 +195,13 @@ class Screenshot(BaseModel):
             replacements["width"] = str(size[0])
             replacements["height"] = str(size[1])
 
-        # Replace placeholders
-        path = self.input_image
-        for key, value in replacements.items():
-            path = path.replace(f"{{{key}}}", value)
+        # Replace known placeholders in one pass, leaving any whose value is
+        # unavailable (e.g. {size} without a size argument) untouched
+        path = _INPUT_PLACEHOLDER_RE.sub(
+            lambda match: replacements.get(match.group(1), match.group(0)), self.input_image
+        )
 
+        self._input_image_cache[key] = path
         return path
 
     def get_input_image(
@@ -217,30 +249,23 @@ class ImageStyle(BaseModel):
         ),
     )
 
+    @cached_property
+    def padding_values(self) -> tuple[int, int, int, int]:
+        """Padding as (top, right, bottom, left), expanded once per instance."""
+        return _expand_to_four(self.padding)
+
+    @cached_property
+    def corner_radius_values(self) -> tuple[int, int, int, int]:
+        """Corner radii as (top-left, top-right, bottom-right, bottom-left), expanded once per instance."""
+        return _expand_to_four(self.corner_radius)
+
     def get_padding_values(self) -> tuple[int, int, int, int]:
         """Get padding values as (top, right, bottom, left) tuple.
 
         Returns:
             Tuple of (top, right, bottom, left) padding values
         """
-        if isinstance(self.padding, int):
-            # Single value: all sides
-            return (self.padding, self.padding, self.padding, self.padding)
-        else:
-            # Must be a list
-            if len(self.padding) == 2:
-                # [vertical, horizontal]
-                return (self.padding[0], self.padding[1], self.padding[0], self.padding[1])
-            elif len(self.padding) == 3:
-                # [top, horizontal, bottom]
-                return (self.padding[0], self.padding[1], self.padding[2], self.padding[1])
-            elif len(self.padding) == 4:
-                # [top, right, bottom, left]
-                return (self.padding[0], self.padding[1], self.padding[2], self.padding[3])
-            else:
-                # Invalid length, use first value for all sides or 0
-                value = self.padding[0] if self.padding else 0
-                return (value, value, value, value)
+        return self.padding_values
 
     def get_corner_radius_values(self) -> tuple[int, int, int, int]:
         """Get corner radius values as (top-left, top-right, bottom-right, bottom-left) tuple.
@@ -248,24 +273,7 @@ class ImageStyle(BaseModel):
         Returns:
             Tuple of (top-left, top-right, bottom-right, bottom-left) radius values
         """
-        if isinstance(self.corner_radius, int):
-            # Single value: all corners
-            return (self.corner_radius, self.corner_radius, self.corner_radius, self.corner_radius)
-        else:
-            # Must be a list
-            if len(self.corner_radius) == 2:
-                # [top-left/bottom-right, top-right/bottom-left] (diagonal pairs)
-                return (self.corner_radius[0], self.corner_radius[1], self.corner_radius[0], self.corner_radius[1])
-            elif len(self.corner_radius) == 3:
-                # [top-left, top-right/bottom-left, bottom-right]
-                return (self.corner_radius[0], self.corner_radius[1], self.corner_radius[2], self.corner_radius[1])
-            elif len(self.corner_radius) == 4:
-                # [top-left, top-right, bottom-right, bottom-left]
-                return (self.corner_radius[0], self.corner_radius[1], self.corner_radius[2], self.corner_radius[3])
-            else:
-                # Invalid length, use first value for all corners or 0
-                value = self.corner_radius[0] if self.corner_radius else 0
-                return (value, value, value, value)
+        return self.corner_radius_values
 
 
 class Theme(BaseModel):
@@ -297,3 +305,8 @@ class ScreenshotConfig(BaseModel):
     default_theme: str = Field(default="standard", description="Default preset theme to use")
 
     screenshots: list[Screenshot] = Field(..., description="List of screenshots to generate")
+
+    @cached_property
+    def configured_languages(self) -> frozenset[str]:
+        """Configured languages as a frozenset (empty when unset), hashed once."""
+        return frozenset(self.languages or ())
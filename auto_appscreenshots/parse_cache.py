@@ -0,0 +1,97 @@
+"""Disk-backed cache for validated configuration files."""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from .models import ScreenshotConfig
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache entry layout or the models change incompatibly
+_CACHE_FORMAT_VERSION = 1
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory for parsed configurations.
+
+    Respects $XDG_CACHE_HOME, falling back to ~/.cache.
+
+    Returns:
+        Path to the cache directory (not necessarily existing yet)
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base_dir / "auto-appscreenshots"
+
+
+def _cache_file_for(config_path: Path) -> Path:
+    """Compute the cache file path for a configuration file.
+
+    The key covers both the resolved path and the file content, so identical
+    configs in different directories (which resolve relative paths
+    differently) never share an entry.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(str(config_path.resolve()).encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(config_path.read_bytes())
+    return get_cache_dir() / f"{hasher.hexdigest()}.pkl"
+
+
+def load_cached_config(config_path: Path) -> ScreenshotConfig | None:
+    """Load a previously validated config for the given file, if still fresh.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Cached ScreenshotConfig, or None on miss or stale entry
+    """
+    try:
+        cache_file = _cache_file_for(config_path)
+        if not cache_file.exists():
+            return None
+
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_FORMAT_VERSION:
+            return None
+        if entry.get("mtime_ns") != config_path.stat().st_mtime_ns:
+            return None
+
+        config = entry.get("config")
+        if isinstance(config, ScreenshotConfig):
+            logger.debug(f"Config cache hit: {cache_file.name}")
+            return config
+        return None
+    except Exception as e:
+        # A broken cache must never break the CLI; fall back to a full parse
+        logger.debug(f"Failed to load config cache for {config_path}: {e}")
+        return None
+
+
+def store_cached_config(config_path: Path, config: ScreenshotConfig) -> None:
+    """Persist a validated config so later runs can skip YAML parsing.
+
+    Args:
+        config_path: Path to the YAML configuration file
+        config: Validated configuration to cache
+    """
+    try:
+        cache_file = _cache_file_for(config_path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "version": _CACHE_FORMAT_VERSION,
+            "mtime_ns": config_path.stat().st_mtime_ns,
+            "config": config,
+        }
+        with open(cache_file, "wb") as f:
+            pickle.dump(entry, f)
+        logger.debug(f"Stored config cache: {cache_file.name}")
+    except Exception as e:
+        logger.debug(f"Failed to write config cache for {config_path}: {e}")
@@ -1,50 +1,57 @@
 """Built-in preset themes for screenshot generation."""
 
-from enum import Enum
-from typing import Any
-
-
-class PresetThemeName(str, Enum):
-    """Available preset theme names."""
-
-    STANDARD = "standard"
-    STANDARD_INVERTED = "standard_inverted"
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final, Literal
+
+# Theme names are plain strings: they are only used as dict keys and every
+# public API takes str, so an Enum would add wrap/hash cost for no benefit
+PresetThemeName = Literal["standard", "standard_inverted"]
+
+# Preset theme configurations, module-level so lookups skip the class
+_THEMES: Final[dict[str, dict[str, Any]]] = {
+    "standard": {
+        "text_layout": "standard",
+        "description": "Standard layout with main text on top, sub text on bottom",
+    },
+    "standard_inverted": {
+        "text_layout": "inverted",
+        "description": "Inverted layout with sub text on top, main text on bottom",
+    },
+}
+
+# Read-only theme name -> text layout view, flattened once at import so the
+# per-render lookup is a single dict access
+TEXT_LAYOUTS: Mapping[str, str] = MappingProxyType({name: config["text_layout"] for name, config in _THEMES.items()})
 
 
 class PresetThemes:
     """Manages built-in preset themes."""
 
-    # Define preset theme configurations
-    THEMES: dict[str, dict[str, Any]] = {
-        PresetThemeName.STANDARD: {
-            "text_layout": "standard",
-            "description": "Standard layout with main text on top, sub text on bottom",
-        },
-        PresetThemeName.STANDARD_INVERTED: {
-            "text_layout": "inverted",
-            "description": "Inverted layout with sub text on top, main text on bottom",
-        },
-    }
+    THEMES: dict[str, dict[str, Any]] = _THEMES
 
     @classmethod
     def get_theme_config(cls, theme_name: str) -> dict[str, Any]:
         """Get configuration for a preset theme."""
-        if theme_name not in cls.THEMES:
-            raise ValueError(f"Unknown preset theme: {theme_name}. Available themes: {list(cls.THEMES.keys())}")
-        return cls.THEMES[theme_name]
+        config = _THEMES.get(theme_name)
+        if config is None:
+            raise ValueError(f"Unknown preset theme: {theme_name}. Available themes: {list(_THEMES.keys())}")
+        return config
 
     @classmethod
     def get_text_layout(cls, theme_name: str) -> str:
         """Get text layout mode for a preset theme."""
-        config = cls.get_theme_config(theme_name)
-        return str(config["text_layout"])
+        layout = TEXT_LAYOUTS.get(theme_name)
+        if layout is None:
+            raise ValueError(f"Unknown preset theme: {theme_name}. Available themes: {list(_THEMES.keys())}")
+        return layout
 
     @classmethod
     def is_valid_theme(cls, theme_name: str) -> bool:
         """Check if a theme name is valid."""
-        return theme_name in cls.THEMES
+        return theme_name in _THEMES
 
     @classmethod
     def list_themes(cls) -> list[str]:
         """List all available preset theme names."""
-        return list(cls.THEMES.keys())
+        return list(_THEMES.keys())
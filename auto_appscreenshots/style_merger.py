@@ -1,20 +1,58 @@
 """Style merging utilities following Single Responsibility Principle."""
 
+import sys
+import weakref
 from typing import Any
 
 from .models import ImageStyle, LocalizedTextStyle, TextStyle, Theme
 
+# Field names hoisted out of the hot loops; interned so the per-field dict
+# lookups compare by pointer
+_LTS_FIELDS = tuple(sys.intern(field) for field in LocalizedTextStyle.model_fields)
+
+# Resolved-style cache for get_style_for_language, keyed on the localized
+# style's identity plus the language pair. Models are not hashable, so
+# entries key on id() and a weakref callback evicts them when the source
+# style is garbage collected (which also guards against id reuse).
+#
+# Resolved styles stay TextStyle instances on purpose: they are assembled
+# with model_construct (no per-field validation) and served from this
+# cache, so construction is off the hot path, and the renderer relies on
+# the model's cached color_rgba/shadow_color_rgba properties.
+_RESOLVED_STYLES: dict[tuple[int, str | None, str | None], TextStyle] = {}
+_STYLE_REFS: dict[int, "weakref.ref[LocalizedTextStyle]"] = {}
+
+# Per-style "shape": the fields that are actually set, precomputed once so
+# resolving another language only walks the 2-4 present fields instead of
+# all ten. Each entry is (field_name, value, value is a per-language dict).
+_STYLE_FIELDS: dict[int, tuple[tuple[str, Any, bool], ...]] = {}
+
+
+def _evict_resolved_styles(style_id: int) -> None:
+    _STYLE_REFS.pop(style_id, None)
+    _STYLE_FIELDS.pop(style_id, None)
+    for key in [key for key in _RESOLVED_STYLES if key[0] == style_id]:
+        del _RESOLVED_STYLES[key]
+
 
 class StyleMerger:
     """Handles merging of text styles and theme configurations."""
 
     @staticmethod
     def merge_text_styles(defaults: TextStyle, override: TextStyle) -> TextStyle:
-        """Merge two text styles with override taking precedence."""
-        merged = defaults.model_copy()
-        for field_name, field_value in override.model_dump(exclude_unset=True).items():
-            setattr(merged, field_name, field_value)
-        return merged
+        """Merge two text styles with override taking precedence.
+
+        Both inputs were validated at config load, so the merged model is
+        assembled with model_construct to skip re-validation.
+        """
+        # Nothing to override (common for unstyled screenshots): no copy
+        if not override.model_fields_set:
+            return defaults
+
+        merged = dict(defaults.__dict__)
+        for field_name in override.model_fields_set:
+            merged[field_name] = getattr(override, field_name)
+        return TextStyle.model_construct(**merged)
 
     @staticmethod
     def merge_localized_text_styles(
@@ -25,68 +63,67 @@ class StyleMerger:
             return defaults_style
         if not defaults_style:
             return override_style
+        if not override_style.model_fields_set:
+            return defaults_style
 
-        merged = defaults_style.model_copy()
+        # Merge each property straight from the instance dicts, then build
+        # the result once; both inputs are already-validated models
+        merged_kwargs = dict(defaults_style.__dict__)
+        override_dict = override_style.__dict__
 
-        # Merge each property
-        for field_name in LocalizedTextStyle.model_fields:
-            defaults_value = getattr(defaults_style, field_name, None)
-            override_value = getattr(override_style, field_name, None)
+        for field_name in _LTS_FIELDS:
+            override_value = override_dict.get(field_name)
 
             if override_value is not None:
+                defaults_value = merged_kwargs.get(field_name)
                 if isinstance(defaults_value, dict) and isinstance(override_value, dict):
                     # Both are dicts, merge them
-                    merged_dict: dict[str, Any] = {}
-                    merged_dict.update(defaults_value)  # type: ignore[arg-type, unused-ignore]
-                    merged_dict.update(override_value)  # type: ignore[arg-type, unused-ignore]
-                    setattr(merged, field_name, merged_dict)
+                    merged_kwargs[field_name] = {**defaults_value, **override_value}
                 else:
                     # Override value takes precedence
-                    setattr(merged, field_name, override_value)
+                    merged_kwargs[field_name] = override_value
 
-        return merged
+        return LocalizedTextStyle.model_construct(**merged_kwargs)
 
     @staticmethod
     def merge_themes(defaults_theme: Theme, override_theme: Theme) -> Theme:
-        """Merge two themes with override taking precedence."""
-        merged = defaults_theme.model_copy()
-
-        # Merge text_area_height
-        if override_theme.text_area_height is not None:
-            merged.text_area_height = override_theme.text_area_height
-
-        # Merge background_color
-        if override_theme.background_color is not None:
-            merged.background_color = override_theme.background_color
-
-        # Merge image_style
-        if override_theme.image_style:
-            merged.image_style = (
-                StyleMerger.merge_image_styles(merged.image_style, override_theme.image_style)
-                if merged.image_style
-                else override_theme.image_style
-            )
+        """Merge two themes with override taking precedence.
 
-        # Merge text styles
-        if override_theme.main_text_style:
-            merged.main_text_style = StyleMerger.merge_localized_text_styles(
-                merged.main_text_style, override_theme.main_text_style
-            )
+        Assembled with model_construct from already-validated inputs; no
+        intermediate model_copy.
+        """
+        overrides = {key: value for key, value in override_theme.__dict__.items() if value is not None}
+
+        # Nothing overridden: share the defaults theme as-is
+        if not overrides:
+            return defaults_theme
 
-        if override_theme.sub_text_style:
-            merged.sub_text_style = StyleMerger.merge_localized_text_styles(
-                merged.sub_text_style, override_theme.sub_text_style
+        # Style fields merge recursively instead of replacing wholesale
+        if "image_style" in overrides and defaults_theme.image_style:
+            overrides["image_style"] = StyleMerger.merge_image_styles(
+                defaults_theme.image_style, overrides["image_style"]
+            )
+        if "main_text_style" in overrides:
+            overrides["main_text_style"] = StyleMerger.merge_localized_text_styles(
+                defaults_theme.main_text_style, overrides["main_text_style"]
+            )
+        if "sub_text_style" in overrides:
+            overrides["sub_text_style"] = StyleMerger.merge_localized_text_styles(
+                defaults_theme.sub_text_style, overrides["sub_text_style"]
             )
 
-        return merged
+        return Theme.model_construct(**{**defaults_theme.__dict__, **overrides})
 
     @staticmethod
     def merge_image_styles(defaults_style: ImageStyle, override_style: ImageStyle) -> ImageStyle:
-        """Merge two image style configs with override taking precedence."""
-        defaults_dict = defaults_style.model_dump()
-        override_dict = override_style.model_dump(exclude_unset=True)
-        defaults_dict.update(override_dict)
-        return ImageStyle(**defaults_dict)
+        """Merge two image style configs with override taking precedence.
+
+        Inputs are already-validated models, so re-validation is skipped.
+        """
+        merged = dict(defaults_style.__dict__)
+        for field_name in override_style.model_fields_set:
+            merged[field_name] = getattr(override_style, field_name)
+        return ImageStyle.model_construct(**merged)
 
     @staticmethod
     def get_style_for_language(
@@ -99,34 +136,50 @@ class StyleMerger:
         2. Default language value (if different from requested language)
         3. Direct value (not in dictionary)
         """
-        style_dict: dict[str, Any] = {}
+        # The result depends only on the style object and the language pair,
+        # and this runs for every screenshot x language x size combination
+        style_id = id(localized_style)
+        key = (style_id, language, default_language)
+        ref = _STYLE_REFS.get(style_id)
+        if ref is not None and ref() is localized_style:
+            cached = _RESOLVED_STYLES.get(key)
+            if cached is not None:
+                return cached
+        else:
+            _STYLE_FIELDS.pop(style_id, None)
+
+            def _on_collect(_ref: weakref.ref[LocalizedTextStyle], style_id: int = style_id) -> None:
+                _evict_resolved_styles(style_id)
+
+            _STYLE_REFS[style_id] = weakref.ref(localized_style, _on_collect)
+
+        # Most styles set only a few fields; the present-field shape is
+        # computed once per style and shared across language resolutions
+        present_fields = _STYLE_FIELDS.get(style_id)
+        if present_fields is None:
+            style_values = localized_style.__dict__
+            present_fields = tuple(
+                (field_name, value, isinstance(value, dict))
+                for field_name in _LTS_FIELDS
+                if (value := style_values.get(field_name)) is not None
+            )
+            _STYLE_FIELDS[style_id] = present_fields
 
         # Build style dictionary by extracting values for the specified language
-        for field_name in [
-            "font_family",
-            "font_style",
-            "font_weight",
-            "font_size",
-            "color",
-            "offset",
-            "shadow",
-            "shadow_color",
-            "shadow_offset",
-            "shadow_blur",
-        ]:
-            value = getattr(localized_style, field_name, None)
-
-            if value is not None:
-                if isinstance(value, dict):
-                    # Try to get language-specific value
-                    if language and language in value:
-                        style_dict[field_name] = value[language]
-                    elif default_language and default_language in value:
-                        # Fallback to default language
-                        style_dict[field_name] = value[default_language]
-                else:
-                    # Direct value (applies to all languages)
-                    style_dict[field_name] = value
-
-        # Use defaults from TextStyle for any missing values
-        return TextStyle(**style_dict)
+        style_dict: dict[str, Any] = {}
+        for field_name, value, is_language_dict in present_fields:
+            if is_language_dict:
+                # Language-specific value, falling back to the default language
+                if language and language in value:
+                    style_dict[field_name] = value[language]
+                elif default_language and default_language in value:
+                    style_dict[field_name] = value[default_language]
+            else:
+                # Direct value (applies to all languages)
+                style_dict[field_name] = value
+
+        # Values extracted from an already-validated model; model_construct
+        # fills TextStyle defaults for the missing fields without re-validating
+        resolved = TextStyle.model_construct(**style_dict)
+        _RESOLVED_STYLES[key] = resolved
+        return resolved
@@ -1,16 +1,60 @@
 """Text rendering utilities following Single Responsibility Principle."""
 
 import logging
+from typing import Any
 
-from PIL import ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 from .font_finder import FontFinder
 from .image_processor import ImageProcessor
 from .models import TextStyle
 
+try:
+    # Optional: JIT-compiled layout math, used when numba is installed
+    import numba  # type: ignore[import-untyped, import-not-found, unused-ignore]
+except ImportError:
+    numba = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _calc_text_y(
+    text_area_height: int,
+    text_height: int,
+    bbox_top: int,
+    is_main: bool,
+    has_sub_text: bool,
+    is_inverted: bool,
+) -> int:
+    """Vertical text position branch tree (pure int math, see render layouts)."""
+    if is_inverted:
+        # Inverted layout: sub_text on top, main_text on bottom
+        if is_main:
+            if has_sub_text:
+                y = int(text_area_height * 0.65) - text_height // 2
+            else:
+                y = (text_area_height - text_height) // 2 - bbox_top
+        else:
+            y = int(text_area_height * 0.25) - text_height // 2
+    else:
+        # Standard layout: main_text on top, sub_text on bottom
+        if is_main:
+            if has_sub_text:
+                y = int(text_area_height * 0.25) - text_height // 2
+            else:
+                y = (text_area_height - text_height) // 2 - bbox_top
+        else:
+            y = int(text_area_height * 0.65) - text_height // 2
+
+    return y
+
+
+if numba is not None:
+    # Lazy jit (no eager signature) so CLI cold start does not pay for the
+    # compile; the on-disk cache makes later runs start compiled
+    _calc_text_y = numba.njit(cache=True)(_calc_text_y)  # type: ignore[misc, unused-ignore]
+
+
 class TextPosition:
     """Represents text position and layout information."""
 
@@ -40,6 +84,10 @@ class TextRenderer:
 
     def __init__(self) -> None:
         self.image_processor = ImageProcessor()
+        # Instance-level caches: one renderer lives for a whole generation
+        # run, and screenshots share a handful of (font, text) pairs
+        self._font_cache: dict[tuple[str, int, str | None, str], ImageFont.FreeTypeFont | ImageFont.ImageFont] = {}
+        self._metrics_cache: dict[tuple[Any, str], tuple[int, int, int]] = {}
 
     def render_text(self, draw: ImageDraw.ImageDraw, text: str, position: TextPosition, style: TextStyle) -> None:
         """Render text with specified style at given position."""
@@ -48,23 +96,23 @@ class TextRenderer:
         # Calculate text dimensions and position
         x, y = self._calculate_text_position(draw, text, font, position, style)
 
-        # Draw shadow if enabled
         if style.shadow:
-            self._draw_shadow(draw, text, x, y, font, style)
-
-        # Draw main text
-        text_color = self.image_processor.parse_color(style.color)
-        draw.text((x, y), text, font=font, fill=text_color)  # type: ignore[attr-defined, unused-ignore]
+            # Shadow and foreground share one glyph rasterization
+            self._render_with_shadow(draw, text, x, y, font, style)
+        else:
+            # Draw main text; the RGBA tuple is parsed once per style
+            draw.text((x, y), text, font=font, fill=style.color_rgba)  # type: ignore[attr-defined, unused-ignore]
 
     def _load_font(
         self, font_family: str, font_size: int, font_weight: str | None = None, font_style: str = "normal"
     ) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        """Load font with fallback to default."""
-        font = FontFinder.load_font(font_family, font_size, font_weight, font_style)
-        if font:
-            return font
-        else:
-            return ImageFont.load_default()
+        """Load font with fallback to default, memoized per renderer."""
+        key = (font_family, font_size, font_weight, font_style)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = FontFinder.load_font(font_family, font_size, font_weight, font_style) or ImageFont.load_default()
+            self._font_cache[key] = font
+        return font
 
     def _calculate_text_position(
         self,
@@ -75,10 +123,14 @@ class TextRenderer:
         style: TextStyle,
     ) -> tuple[int, int]:
         """Calculate final text position including offsets."""
-        # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = int(bbox[2] - bbox[0])
-        text_height = int(bbox[3] - bbox[1])
+        # Get text bounding box; metrics are pure functions of (font, text)
+        # so repeated renders of the same pair skip FreeType's measurement
+        metrics = self._metrics_cache.get((font, text))
+        if metrics is None:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            metrics = (int(bbox[2] - bbox[0]), int(bbox[3] - bbox[1]), int(bbox[1]))
+            self._metrics_cache[(font, text)] = metrics
+        text_width, text_height, bbox_top = metrics
 
         # Center text horizontally
         x = (position.width - text_width) // 2
@@ -87,7 +139,7 @@ class TextRenderer:
         y = self._calculate_vertical_position(
             position.text_area_height,
             text_height,
-            int(bbox[1]),
+            bbox_top,
             position.is_main,
             position.has_sub_text,
             position.is_inverted,
@@ -110,28 +162,9 @@ class TextRenderer:
         is_inverted: bool,
     ) -> int:
         """Calculate vertical position based on layout configuration."""
-        if is_inverted:
-            # Inverted layout: sub_text on top, main_text on bottom
-            if is_main:
-                if has_sub_text:
-                    y = int(text_area_height * 0.65) - text_height // 2
-                else:
-                    y = (text_area_height - text_height) // 2 - bbox_top
-            else:
-                y = int(text_area_height * 0.25) - text_height // 2
-        else:
-            # Standard layout: main_text on top, sub_text on bottom
-            if is_main:
-                if has_sub_text:
-                    y = int(text_area_height * 0.25) - text_height // 2
-                else:
-                    y = (text_area_height - text_height) // 2 - bbox_top
-            else:
-                y = int(text_area_height * 0.65) - text_height // 2
-
-        return y
+        return int(_calc_text_y(text_area_height, text_height, bbox_top, is_main, has_sub_text, is_inverted))
 
-    def _draw_shadow(
+    def _render_with_shadow(
         self,
         draw: ImageDraw.ImageDraw,
         text: str,
@@ -140,7 +173,31 @@ class TextRenderer:
         font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
         style: TextStyle,
     ) -> None:
-        """Draw text shadow."""
+        """Draw shadow and foreground text from a single glyph mask.
+
+        Rendering with draw.text twice would rasterize the glyphs twice and
+        has no way to blur the shadow (shadow_blur used to be ignored).
+        The text is rasterized once into an "L" mask, then stamped twice
+        with draw.bitmap: a Gaussian-blurred copy in the shadow color at the
+        shadow offset, and the sharp copy in the text color on top.
+        """
+        bbox = font.getbbox(text)
+        left, top = int(bbox[0]), int(bbox[1])
+        width, height = int(bbox[2]) - left, int(bbox[3]) - top
+        if width <= 0 or height <= 0:
+            return
+
+        blur = max(style.shadow_blur, 0)
+        # Margin so the blur does not clip at the mask edges
+        pad = blur * 2
+        mask = Image.new("L", (width + 2 * pad, height + 2 * pad), 0)
+        ImageDraw.Draw(mask).text((pad - left, pad - top), text, font=font, fill=255)
+
+        shadow_mask = mask.filter(ImageFilter.GaussianBlur(blur)) if blur else mask
+
+        # draw.text((x, y)) puts the ink at (x + left, y + top); the mask
+        # origin compensates for its padding
+        origin_x, origin_y = x + left - pad, y + top - pad
         shadow_offset_x, shadow_offset_y = style.shadow_offset
-        shadow_color = self.image_processor.parse_color(style.shadow_color)
-        draw.text((x + shadow_offset_x, y + shadow_offset_y), text, font=font, fill=shadow_color)  # type: ignore[attr-defined, unused-ignore]
+        draw.bitmap((origin_x + shadow_offset_x, origin_y + shadow_offset_y), shadow_mask, fill=style.shadow_color_rgba)
+        draw.bitmap((origin_x, origin_y), mask, fill=style.color_rgba)
@@ -1,8 +1,10 @@
 """UI reporting abstraction for progress feedback."""
 
 import logging
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -46,15 +48,18 @@ class ConsoleReporter(UIReporter):
         if self.verbose:
             print(f"\n  Processing screenshot {index}/{total}: {name}")
         else:
-            print(f"  [{index}/{total}] {name}... ", end="", flush=True)
+            # One write + flush instead of the print machinery; stays in the
+            # text layer so ordering with other output is preserved
+            sys.stdout.write(f"  [{index}/{total}] {name}... ")
+            sys.stdout.flush()
 
     def report_screenshot_success(self, paths: list[Path]) -> None:
         """Report successful screenshot generation."""
         if self.verbose:
-            for path in paths:
-                resolution_dir = path.parent.name
-                print(f"    ✓ {resolution_dir}/{path.name}")
-                logger.debug(f"Generated: {path}")
+            # Single buffered write per screenshot instead of one per path
+            sys.stdout.write("".join(f"    ✓ {path.parent.name}/{path.name}\n" for path in paths))
+            # Deferred %s formatting: only rendered if a handler emits it
+            logger.debug("Generated: %s", paths)
         else:
             print("✓")
 
@@ -62,4 +67,39 @@ class ConsoleReporter(UIReporter):
         """Report screenshot generation error."""
         if not self.verbose:
             print("✗")
-        logger.error(f"Failed to generate screenshot: {error}")
+        logger.error("Failed to generate screenshot: %s", error)
+
+
+class BatchReporter(UIReporter):
+    """Buffers reporting calls and replays them later in recorded order.
+
+    Parallel generation completes tasks out of order; the generator records
+    progress events against this reporter in submission order and flushes
+    them to the real reporter once the batch is done, so the output reads
+    the same as a serial run.
+    """
+
+    def __init__(self) -> None:
+        self._events: list[tuple[str, tuple[Any, ...]]] = []
+
+    def report_language_start(self, language: str) -> None:
+        """Buffer a language start event."""
+        self._events.append(("report_language_start", (language,)))
+
+    def report_screenshot_start(self, index: int, total: int, name: str) -> None:
+        """Buffer a screenshot start event."""
+        self._events.append(("report_screenshot_start", (index, total, name)))
+
+    def report_screenshot_success(self, paths: list[Path]) -> None:
+        """Buffer a screenshot success event."""
+        self._events.append(("report_screenshot_success", (paths,)))
+
+    def report_screenshot_error(self, error: Exception) -> None:
+        """Buffer a screenshot error event."""
+        self._events.append(("report_screenshot_error", (error,)))
+
+    def flush(self, target: UIReporter) -> None:
+        """Replay all buffered events to the target reporter and clear."""
+        for method_name, args in self._events:
+            getattr(target, method_name)(*args)
+        self._events.clear()
@@ -1,14 +1,53 @@
 """Configuration validator for screenshot generation."""
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-import click
-import yaml
 from pydantic import ValidationError
 
-from .models import LocalizedTextStyle, ScreenshotConfig
+from .models import LocalizedTextStyle, Screenshot, ScreenshotConfig
 from .preset_themes import PresetThemes
 
+# click and yaml are imported lazily in the methods that need them, so
+# programmatic users of ConfigValidator don't pay their import cost
+
+# YAML loader class, resolved on first parse
+_LOADER: Any = None
+
+
+def _yaml_loader() -> Any:
+    """Resolve the YAML loader once, preferring libyaml's C bindings."""
+    global _LOADER
+    if _LOADER is None:
+        import yaml
+
+        loader_cls: type[yaml.SafeLoader] | type[yaml.CSafeLoader]
+        try:
+            # LibYAML C bindings: much faster parsing, identical semantics
+            loader_cls = yaml.CSafeLoader
+        except AttributeError:
+            loader_cls = yaml.SafeLoader
+        _LOADER = loader_cls
+    return _LOADER
+
+
+# Placeholders that make the input path vary with the output size
+_SIZE_PLACEHOLDERS = frozenset({"size", "width", "height"})
+
+# Field names probed by _validate_style_format, resolved once
+_STYLE_FIELDS = tuple(LocalizedTextStyle.model_fields)
+
+
+@dataclass
+class _ScreenshotStats:
+    """Per-config facts the validators share, gathered in one pass."""
+
+    used_languages: set[str]
+    effective_languages: list[list[str]]
+    output_names: list[str | None]
+
 
 class ConfigValidator:
     """Validates and provides warnings for configuration files."""
@@ -18,6 +57,16 @@ class ConfigValidator:
         self.verbose = verbose
         self.warnings: list[str] = []
         self.errors: list[str] = []
+        # Existence results per resolved path: without size placeholders the
+        # same file is checked for every (language, size) combination
+        self._exists_cache: dict[str, bool] = {}
+        # Path objects per formatted path, so Path construction and the
+        # config-dir join run once per unique path
+        self._resolved_paths: dict[str, Path] = {}
+        # Theme names as a frozenset for O(1) membership; the listing for
+        # error messages is formatted once instead of per message
+        self._valid_themes = frozenset(PresetThemes.list_themes())
+        self._themes_str = ", ".join(sorted(self._valid_themes))
 
     def validate_config_file(self, config_path: str) -> tuple[bool, ScreenshotConfig | None]:
         """
@@ -28,6 +77,8 @@ class ConfigValidator:
         """
         self.warnings = []
         self.errors = []
+        self._exists_cache = {}
+        self._resolved_paths = {}
 
         # Check if file exists
         config_file = Path(config_path)
@@ -39,22 +90,25 @@ class ConfigValidator:
         # Store config directory for resolving relative paths
         self.config_dir = config_file.parent
 
-        # Load YAML
+        # Load YAML from bytes in one read; the loader handles decoding
         try:
-            with open(config_file, encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            self.errors.append(f"YAML parsing error: {e}")
-            self._print_validation_results()
-            return False, None
+            raw = config_file.read_bytes()
         except Exception as e:
             self.errors.append(f"Failed to read configuration file: {e}")
             self._print_validation_results()
             return False, None
 
-        # Validate with Pydantic model
+        config_data, parse_error = self._parse_config(config_file, raw)
+        if parse_error is not None:
+            self.errors.append(parse_error)
+            self._print_validation_results()
+            return False, None
+
+        # Validate with Pydantic model; model_validate hands the parsed
+        # mapping to the core validator directly instead of expanding it
+        # into Python keyword arguments first
         try:
-            config = ScreenshotConfig(**config_data)
+            config = ScreenshotConfig.model_validate(config_data)
         except ValidationError as e:
             for error in e.errors():
                 location = " -> ".join(str(loc) for loc in error["loc"])
@@ -66,46 +120,167 @@ class ConfigValidator:
             self._print_validation_results()
             return False, None
 
-        # Run custom validations
-        self._validate_screenshot_config(config)
+        # Run custom validations; the screenshot pass is shared
+        stats = self._collect_screenshot_stats(config)
+        self._validate_screenshot_config(config, stats)
         self._validate_theme_styles(config)
-        self._validate_languages(config)
-        self._validate_file_paths(config)
+        self._validate_languages(config, stats)
+        self._validate_file_paths(stats)
 
         # Print results
         self._print_validation_results()
 
         return len(self.errors) == 0, config if len(self.errors) == 0 else None
 
-    def _validate_screenshot_config(self, config: ScreenshotConfig) -> None:
+    def _parse_config(self, config_file: Path, raw: bytes) -> tuple[Any, str | None]:
+        """Parse raw config bytes, choosing the parser by file type.
+
+        JSON configs use orjson when it is installed; everything else —
+        including JSON without orjson, since YAML is a superset — goes
+        through the YAML loader.
+
+        Returns:
+            Tuple of (parsed data, error message or None)
+        """
+        if config_file.suffix == ".json":
+            try:
+                import orjson
+            except ImportError:
+                orjson = None  # type: ignore[assignment]
+            if orjson is not None:
+                try:
+                    return orjson.loads(raw), None
+                except orjson.JSONDecodeError as e:
+                    return None, f"JSON parsing error: {e}"
+
+        import yaml
+
+        try:
+            return yaml.load(raw, Loader=_yaml_loader()), None
+        except yaml.YAMLError as e:
+            return None, f"YAML parsing error: {e}"
+        except Exception as e:
+            return None, f"Failed to read configuration file: {e}"
+
+    def _collect_screenshot_stats(self, config: ScreenshotConfig) -> _ScreenshotStats:
+        """Gather the per-screenshot facts the validators need in one pass."""
+        used_languages: set[str] = set()
+        effective_languages: list[list[str]] = []
+        output_names: list[str | None] = []
+
+        for screenshot in config.screenshots:
+            screenshot_languages = list(screenshot.text.main_text.keys()) if screenshot.text else []
+            used_languages.update(screenshot_languages)
+            effective_languages.append(config.languages or screenshot_languages)
+            output_names.append(screenshot.output_name)
+
+        return _ScreenshotStats(
+            used_languages=used_languages,
+            effective_languages=effective_languages,
+            output_names=output_names,
+        )
+
+    def _input_variants(
+        self, screenshot: Screenshot, languages: list[str], output_sizes: list[tuple[int, int]]
+    ) -> tuple[list[str], list[tuple[int, int]]]:
+        """Collapse the language/size combinations the template cannot distinguish.
+
+        A template without a {lang} placeholder resolves identically for
+        every language, and one without size placeholders for every size,
+        so only one representative of the collapsed dimension is checked.
+        """
+        placeholders = screenshot.input_image_placeholders
+        lang_variants = languages if "lang" in placeholders else languages[:1]
+        size_variants = output_sizes if placeholders & _SIZE_PLACEHOLDERS else output_sizes[:1]
+        return lang_variants, size_variants
+
+    def _iter_input_combinations(
+        self, screenshot: Screenshot, languages: list[str], output_sizes: list[tuple[int, int]]
+    ) -> list[tuple[str, tuple[int, int]]]:
+        """List the distinguishable (language, size) pairs for a screenshot."""
+        lang_variants, size_variants = self._input_variants(screenshot, languages, output_sizes)
+        return [(lang, size) for lang in lang_variants for size in size_variants]
+
+    def _resolve_input_path(self, screenshot: Screenshot, language: str, size: tuple[int, int]) -> tuple[str, Path]:
+        """Resolve a screenshot's input path for one (language, size) pair."""
+        formatted_path = screenshot.format_input_image(language, size)
+        input_path = self._resolved_paths.get(formatted_path)
+        if input_path is None:
+            input_path = Path(formatted_path)
+
+            # Resolve relative paths relative to config directory
+            if not input_path.is_absolute() and hasattr(self, "config_dir"):
+                input_path = self.config_dir / input_path
+
+            self._resolved_paths[formatted_path] = input_path
+
+        return formatted_path, input_path
+
+    def _prime_exists_cache(self, paths: list[Path]) -> None:
+        """Fill the existence cache with one directory read per parent.
+
+        Input images cluster in a few directories, so listing each parent
+        with os.scandir replaces one stat syscall per (screenshot,
+        language, size) combination with one readdir per directory.
+        """
+        by_parent: dict[Path, list[tuple[str, str]]] = {}
+        for path in paths:
+            key = str(path)
+            if key not in self._exists_cache:
+                by_parent.setdefault(path.parent, []).append((key, path.name))
+
+        for parent, entries in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            for key, name in entries:
+                # The name-set comparison is byte-exact, but Path.exists()
+                # is case-insensitive on default macOS volumes; confirm a
+                # miss with one stat so casing differences don't warn
+                self._exists_cache[key] = name in names or Path(key).exists()
+
+    def _validate_screenshot_config(self, config: ScreenshotConfig, stats: _ScreenshotStats) -> None:
         """Validate individual screenshot configurations."""
+        self._prime_exists_cache(
+            [
+                self._resolve_input_path(screenshot, lang, size)[1]
+                for screenshot, languages in zip(config.screenshots, stats.effective_languages)
+                for lang, size in self._iter_input_combinations(screenshot, languages, config.output_sizes)
+            ]
+        )
+
         for i, screenshot in enumerate(config.screenshots, 1):
-            # Check for each language and size combination
-            languages = config.languages or list(screenshot.text.main_text.keys())
-            for lang in languages:
-                for size in config.output_sizes:
-                    # Format the path with placeholders
-                    formatted_path = screenshot.format_input_image(lang, size)
-                    input_path = Path(formatted_path)
-
-                    # Resolve relative paths relative to config directory
-                    if not input_path.is_absolute() and hasattr(self, "config_dir"):
-                        input_path = self.config_dir / input_path
-
-                    # Check if file exists
-                    if not input_path.exists():
-                        size_str = f"{size[0]}x{size[1]}"
-                        self.warnings.append(
-                            f"Screenshot {i}: Input image not found for "
-                            f"lang='{lang}', size='{size_str}': {formatted_path}"
-                        )
+            # Check each language and size combination the template can produce
+            placeholders = screenshot.input_image_placeholders
+            lang_variants, size_variants = self._input_variants(
+                screenshot, stats.effective_languages[i - 1], config.output_sizes
+            )
+            for lang in lang_variants:
+                for size in size_variants:
+                    formatted_path, input_path = self._resolve_input_path(screenshot, lang, size)
+
+                    # Check if file exists (one stat per unique path)
+                    cache_key = str(input_path)
+                    exists = self._exists_cache.get(cache_key)
+                    if exists is None:
+                        exists = self._exists_cache[cache_key] = input_path.exists()
+                    if not exists:
+                        # Only name the dimensions the template depends on
+                        details = []
+                        if "lang" in placeholders:
+                            details.append(f"lang='{lang}'")
+                        if placeholders & _SIZE_PLACEHOLDERS:
+                            details.append(f"size='{size[0]}x{size[1]}'")
+                        qualifier = f" for {', '.join(details)}" if details else ""
+                        self.warnings.append(f"Screenshot {i}: Input image not found{qualifier}: {formatted_path}")
 
             # Validate theme
             if screenshot.theme:
-                if not PresetThemes.is_valid_theme(screenshot.theme):
+                if screenshot.theme not in self._valid_themes:
                     self.errors.append(
-                        f"Screenshot {i}: Invalid theme '{screenshot.theme}'. "
-                        f"Available themes: {PresetThemes.list_themes()}"
+                        f"Screenshot {i}: Invalid theme '{screenshot.theme}'. Available themes: {self._themes_str}"
                     )
 
             # Check for empty text
@@ -121,19 +296,19 @@ class ConfigValidator:
 
     def _validate_style_format(self, style: LocalizedTextStyle, location: str) -> None:
         """Validate that style has at least one property defined."""
-        style_dict = style.model_dump(exclude_none=True)
-
-        if not style_dict:
+        # Attribute probe instead of model_dump: no dict materialized just
+        # to test emptiness
+        style_values = style.__dict__
+        if not any(style_values.get(field) is not None for field in _STYLE_FIELDS):
             self.warnings.append(f"{location}: Style should have at least one property defined")
 
     def _validate_theme_styles(self, config: ScreenshotConfig) -> None:
         """Validate theme style configurations."""
         # Check for invalid theme names
         for theme_name in config.theme_styles.keys():
-            if not PresetThemes.is_valid_theme(theme_name):
+            if theme_name not in self._valid_themes:
                 self.warnings.append(
-                    f"Theme style '{theme_name}' does not match any preset theme. "
-                    f"Available themes: {PresetThemes.list_themes()}"
+                    f"Theme style '{theme_name}' does not match any preset theme. Available themes: {self._themes_str}"
                 )
 
         # Validate style formats
@@ -144,17 +319,13 @@ class ConfigValidator:
             if theme.sub_text_style:
                 self._validate_style_format(theme.sub_text_style, f"theme_styles.{theme_name}.sub_text_style")
 
-    def _validate_languages(self, config: ScreenshotConfig) -> None:
+    def _validate_languages(self, config: ScreenshotConfig, stats: _ScreenshotStats) -> None:
         """Validate language configurations."""
-        # Get all languages used in screenshots
-        used_languages: set[str] = set()
-        for screenshot in config.screenshots:
-            if screenshot.text:
-                used_languages.update(screenshot.text.main_text.keys())
+        used_languages = stats.used_languages
 
         # Check if configured languages match used languages
         if config.languages:
-            configured_languages = set(config.languages)
+            configured_languages = config.configured_languages
 
             # Warn about unused configured languages
             unused = configured_languages - used_languages
@@ -168,35 +339,44 @@ class ConfigValidator:
                     f"Languages used in screenshots but not in 'languages' field: {', '.join(unconfigured)}"
                 )
 
-    def _validate_file_paths(self, config: ScreenshotConfig) -> None:
+    def _validate_file_paths(self, stats: _ScreenshotStats) -> None:
         """Validate file paths and output settings."""
         # Check for duplicate output names
-        output_names: dict[str, int] = {}
-        for i, screenshot in enumerate(config.screenshots, 1):
-            if screenshot.output_name:
-                if screenshot.output_name in output_names:
+        seen_names: dict[str, int] = {}
+        for i, output_name in enumerate(stats.output_names, 1):
+            if output_name:
+                if output_name in seen_names:
                     self.warnings.append(
-                        f"Screenshot {i}: Duplicate output_name '{screenshot.output_name}' "
-                        f"(also used in screenshot {output_names[screenshot.output_name]})"
+                        f"Screenshot {i}: Duplicate output_name '{output_name}' "
+                        f"(also used in screenshot {seen_names[output_name]})"
                     )
                 else:
-                    output_names[screenshot.output_name] = i
+                    seen_names[output_name] = i
 
     def _print_validation_results(self) -> None:
         """Print validation errors and warnings."""
+        import click
+
+        # One echo per stream instead of one per message
+        error_lines: list[str] = []
+        info_lines: list[str] = []
+
         if self.errors:
-            click.echo("\n❌ Validation Errors:", err=True)
-            for error in self.errors:
-                click.echo(f"   • {error}", err=True)
+            error_lines.append("\n❌ Validation Errors:")
+            error_lines.extend(f"   • {error}" for error in self.errors)
 
         if self.warnings:
-            click.echo("\n⚠️  Warnings:")
-            for warning in self.warnings:
-                click.echo(f"   • {warning}")
+            info_lines.append("\n⚠️  Warnings:")
+            info_lines.extend(f"   • {warning}" for warning in self.warnings)
 
         if self.errors:
-            click.echo("\n❌ Configuration validation failed", err=True)
+            error_lines.append("\n❌ Configuration validation failed")
         elif self.warnings:
-            click.echo("\n✅ Configuration is valid (with warnings)")
+            info_lines.append("\n✅ Configuration is valid (with warnings)")
         elif self.verbose:
-            click.echo("\n✅ Configuration is valid")
+            info_lines.append("\n✅ Configuration is valid")
+
+        if error_lines:
+            click.echo("\n".join(error_lines), err=True)
+        if info_lines:
+            click.echo("\n".join(info_lines))
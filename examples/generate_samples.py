@@ -2,10 +2,42 @@
 
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from auto_appscreenshots.font_finder import FontFinder
 
+# Background buffers pooled by size and refilled per sample, so each
+# device size allocates its ~11 MB RGB canvas once for the whole batch
+_canvas_pool: dict[tuple[int, int], np.ndarray] = {}
+
+# Fonts cached per (name, weight): the driver reuses each font for every
+# color x size combination, and font discovery walks system directories
+_font_cache: dict[tuple[str, str], "ImageFont.FreeTypeFont | ImageFont.ImageFont"] = {}
+
+
+def _load_sample_font(font_name: str, font_weight: str) -> "ImageFont.FreeTypeFont | ImageFont.ImageFont":
+    """Load a sample font with fallbacks, memoized per (name, weight)."""
+    key = (font_name, font_weight)
+    font = _font_cache.get(key)
+    if font is not None:
+        return font
+
+    loaded = FontFinder.load_font(font_name, 120, weight=font_weight)
+
+    if not loaded:
+        print(f"Warning: Could not load font '{font_name}'. Using fallback.")
+        # Try fallback fonts
+        for fallback_name in ["Arial", "Helvetica", "sans-serif"]:
+            loaded = FontFinder.load_font(fallback_name, 120)
+            if loaded:
+                break
+
+    # Last resort: use default font
+    font = loaded or ImageFont.load_default()
+    _font_cache[key] = font
+    return font
+
 
 def create_sample_screenshot(
     filename: str | Path,
@@ -16,23 +48,17 @@ def create_sample_screenshot(
     font_weight: str = "normal",
 ) -> None:
     """Create a sample screenshot for testing."""
-    image = Image.new("RGB", size, bg_color)
+    # One numpy memset into a pooled buffer instead of Pillow re-parsing
+    # the color string and filling pixel by pixel for every sample
+    buffer = _canvas_pool.get(size)
+    if buffer is None:
+        buffer = _canvas_pool[size] = np.empty((size[1], size[0], 3), dtype=np.uint8)
+    buffer[:] = ImageColor.getrgb(bg_color)
+    image = Image.fromarray(buffer, "RGB")
     draw = ImageDraw.Draw(image)
 
-    # Load font using FontFinder
-    font = FontFinder.load_font(font_name, 120, weight=font_weight)
-
-    if not font:
-        print(f"Warning: Could not load font '{font_name}'. Using fallback.")
-        # Try fallback fonts
-        for fallback_name in ["Arial", "Helvetica", "sans-serif"]:
-            font = FontFinder.load_font(fallback_name, 120)
-            if font:
-                break
-
-        if not font:
-            # Last resort: use default font
-            font = ImageFont.load_default()
+    # Load font using FontFinder (cached across calls)
+    font = _load_sample_font(font_name, font_weight)
 
     bbox = draw.textbbox((0, 0), text, font=font)
     text_width = bbox[2] - bbox[0]
@@ -47,6 +73,14 @@ def create_sample_screenshot(
     print(f"Created: {filename}")
 
 
+def _make_one(task: tuple[Path, tuple[int, int], str, str, str, str]) -> None:
+    """Generate one sample screenshot in a worker process."""
+    filepath, size, bg_color, text, font_name, font_weight = task
+    create_sample_screenshot(
+        filepath, size=size, bg_color=bg_color, text=text, font_name=font_name, font_weight=font_weight
+    )
+
+
 if __name__ == "__main__":
     screenshots_dir = Path("screenshots")
 
@@ -78,7 +112,8 @@ if __name__ == "__main__":
     # Define sample colors
     sample_colors = ["#007AFF", "#34C759", "#FF9500"]
 
-    # Create directories and generate screenshots
+    # Create directories and collect one task per screenshot
+    tasks = []
     for lang, config in language_configs.items():
         lang_dir = screenshots_dir / lang
         lang_dir.mkdir(parents=True, exist_ok=True)
@@ -88,14 +123,14 @@ if __name__ == "__main__":
                 # Filename format: {index}_{widthxheight}.png
                 filename = f"{i}_{size[0]}x{size[1]}.png"
                 filepath = lang_dir / filename
-                create_sample_screenshot(
-                    filepath,
-                    size=size,
-                    bg_color=color,
-                    text=text,
-                    font_name=config["font"],
-                    font_weight=config["weight"],
-                )
+                tasks.append((filepath, size, color, text, config["font"], config["weight"]))
+
+    # Every sample is independent and PNG encoding dominates, so spread
+    # the tasks over worker processes
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_make_one, tasks))
 
     total_created = len(language_configs) * len(sample_colors) * len(sizes)
     print(f"\n✅ Created {total_created} sample screenshots in '{screenshots_dir}' directory")
@@ -1,5 +1,6 @@
 """Shared pytest fixtures for tests."""
 
+import io
 import shutil
 import tempfile
 from collections.abc import Iterator
@@ -9,6 +10,7 @@ from typing import Any
 import pytest
 from PIL import Image
 
+from auto_appscreenshots.image_processor import ImageProcessor
 from auto_appscreenshots.models import (
     ImageStyle,
     LocalizedTextContent,
@@ -20,6 +22,30 @@ from auto_appscreenshots.models import (
 )
 
 
+def _encode_sample_png() -> bytes:
+    """Encode the sample image once; every fixture use writes the same bytes."""
+    buffer = io.BytesIO()
+    Image.new("RGBA", (100, 100), color=(255, 0, 0, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+_SAMPLE_PNG_BYTES = _encode_sample_png()
+
+
+@pytest.fixture(autouse=True)
+def _fast_png(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force cheap PNG encodes; size-optimal output is not under test."""
+    real_save = Image.Image.save
+
+    def fast_save(self: Image.Image, fp: Any, *args: Any, **kwargs: Any) -> None:
+        if kwargs.get("format") == "PNG" or str(fp).lower().endswith(".png"):
+            kwargs["compress_level"] = 1
+            kwargs["optimize"] = False
+        real_save(self, fp, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "save", fast_save)
+
+
 @pytest.fixture
 def temp_dir() -> Iterator[Path]:
     """Create a temporary directory for tests."""
@@ -28,15 +54,20 @@ def temp_dir() -> Iterator[Path]:
     shutil.rmtree(temp_path)
 
 
-@pytest.fixture
-def sample_image(temp_dir: Path) -> Path:
-    """Create a sample test image."""
-    image_path = temp_dir / "test_image.png"
-    img = Image.new("RGBA", (100, 100), color=(255, 0, 0, 255))
-    img.save(image_path)
+@pytest.fixture(scope="session")
+def sample_image(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample test image, shared read-only across the session."""
+    image_path = tmp_path_factory.mktemp("sample_image") / "test_image.png"
+    image_path.write_bytes(_SAMPLE_PNG_BYTES)
     return image_path
 
 
+@pytest.fixture(scope="module")
+def image_processor() -> ImageProcessor:
+    """Shared ImageProcessor; the class keeps no per-instance state."""
+    return ImageProcessor()
+
+
 @pytest.fixture
 def text_style() -> TextStyle:
     """Create a sample TextStyle."""
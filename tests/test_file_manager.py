@@ -1,16 +1,28 @@
 """Tests for file management utilities."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+import pytest
 from PIL import Image
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from auto_appscreenshots.file_manager import FileManager
 from auto_appscreenshots.models import LocalizedTextContent, Screenshot
 
+# Shared solid-red image; save paths read it without mutating
+_RED_100 = Image.new("RGBA", (100, 100), color=(255, 0, 0, 255))
+
 
 class TestFileManager:
     """Test FileManager class."""
 
+    @pytest.fixture(autouse=True)
+    def fake_fs(self, fs: FakeFilesystem) -> Iterator[FakeFilesystem]:
+        """Run every test against an in-memory filesystem."""
+        yield fs
+
     def test_init_creates_directory(self, temp_dir: Path) -> None:
         """Test that initialization creates the base output directory."""
         output_dir = temp_dir / "test_output"
@@ -72,46 +84,67 @@ class TestFileManager:
         assert path.suffix == ".png"
         assert path.name == "no_extension.png"
 
-    def test_save_image(self, temp_dir: Path) -> None:
+    def test_save_image(self, temp_dir: Path, mocker: Any) -> None:
         """Test saving an image."""
         manager = FileManager(temp_dir)
-        image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 255))
         output_path = temp_dir / "test_save.png"
 
-        manager.save_image(image, output_path)
+        # The PNG encoder is not under test; stub save to a zero-byte file
+        mock_save = mocker.patch.object(
+            Image.Image, "save", side_effect=lambda path, **kwargs: Path(path).write_bytes(b"")
+        )
+
+        manager.save_image(_RED_100, output_path)
 
         assert output_path.exists()
+        assert mock_save.call_args.kwargs["format"] == "PNG"
 
-        # Load and verify saved image
-        loaded = Image.open(output_path)
-        assert loaded.size == (100, 100)
-        assert loaded.mode == "RGBA"
-
-    def test_save_image_with_quality(self, temp_dir: Path) -> None:
-        """Test saving an image with custom quality."""
+    def test_save_image_with_quality(self, temp_dir: Path, mocker: Any) -> None:
+        """Test that JPEG saves forward the quality setting."""
         manager = FileManager(temp_dir)
-        image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 255))
-        output_path = temp_dir / "test_quality.png"
+        output_path = temp_dir / "test_quality.jpg"
 
-        manager.save_image(image, output_path, quality=50)
+        mock_save = mocker.patch.object(
+            Image.Image, "save", side_effect=lambda path, **kwargs: Path(path).write_bytes(b"")
+        )
+
+        manager.save_image(_RED_100, output_path, quality=50)
 
         assert output_path.exists()
+        assert mock_save.call_args.kwargs["quality"] == 50
+
+    def test_save_images_batch(self, temp_dir: Path) -> None:
+        """Test saving a batch of images concurrently."""
+        manager = FileManager(temp_dir)
+        items = [(_RED_100, temp_dir / f"batch_{i}.png") for i in range(3)]
+
+        manager.save_images_batch(items)
+
+        for _, path in items:
+            assert path.exists()
 
-    def test_check_input_exists(self, temp_dir: Path, sample_image: Path) -> None:
+    def test_save_images_batch_empty(self, temp_dir: Path) -> None:
+        """Test saving an empty batch is a no-op."""
+        manager = FileManager(temp_dir)
+
+        manager.save_images_batch([])
+
+    def test_check_input_exists(self, temp_dir: Path) -> None:
         """Test checking if input file exists."""
         manager = FileManager(temp_dir)
+        input_image = temp_dir / "input.png"
+        input_image.write_bytes(b"")
 
-        assert manager.check_input_exists(str(sample_image)) is True
+        assert manager.check_input_exists(str(input_image)) is True
         assert manager.check_input_exists("nonexistent.png") is False
 
-    def test_get_output_directories(self, temp_dir: Path) -> None:
+    def test_get_output_directories(self, temp_dir: Path, fake_fs: FakeFilesystem) -> None:
         """Test getting list of output directories."""
         manager = FileManager(temp_dir)
 
-        # Create some directories
-        (temp_dir / "en" / "1320x2868").mkdir(parents=True)
-        (temp_dir / "ja" / "1320x2868").mkdir(parents=True)
-        (temp_dir / "en" / "2064x2752").mkdir(parents=True)
+        # Synthesize the directory tree in the fake filesystem
+        for sub in ("en/1320x2868", "ja/1320x2868", "en/2064x2752"):
+            fake_fs.create_dir(temp_dir / sub)
 
         dirs = manager.get_output_directories()
         dir_names = [str(d.relative_to(temp_dir)) for d in dirs]
@@ -121,6 +154,15 @@ class TestFileManager:
         assert "ja/1320x2868" in dir_names
         assert "en/2064x2752" in dir_names
 
+    def test_get_output_directories_real_walk(self, temp_dir: Path) -> None:
+        """Test that the fallback walk finds directories created via mkdir."""
+        manager = FileManager(temp_dir)
+        (temp_dir / "en" / "1320x2868").mkdir(parents=True)
+
+        dirs = manager.get_output_directories()
+
+        assert dirs == [temp_dir / "en" / "1320x2868"]
+
     def test_process_output_name_placeholders(self, temp_dir: Path) -> None:
         """Test processing output name placeholders."""
         manager = FileManager(temp_dir)
@@ -1,11 +1,13 @@
 """Tests for screenshot generator."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, create_autospec
 
+import numpy as np
 import pytest
 from PIL import Image, ImageDraw
 
+from auto_appscreenshots.file_manager import FileManager
 from auto_appscreenshots.generator import ScreenshotGenerator
 from auto_appscreenshots.models import (
     ImageStyle,
@@ -17,15 +19,42 @@ from auto_appscreenshots.models import (
 )
 from auto_appscreenshots.ui_reporter import UIReporter
 
+# Shared stand-in for loaded screenshots; one zero-copy wrap of a numpy
+# buffer instead of an 8 MB fill per test
+_FAKE_LOAD_IMG = Image.fromarray(np.full((2000, 1000, 4), 255, dtype=np.uint8), mode="RGBA")
+
+# Spec introspection runs once at import; tests reset call state instead
+_REPORTER_MOCK: Mock = create_autospec(UIReporter, instance=True)
+
 
 class TestScreenshotGenerator:
     """Test ScreenshotGenerator class."""
 
     @pytest.fixture
     def mock_reporter(self) -> Mock:
-        """Create mock UI reporter."""
-        reporter = MagicMock(spec=UIReporter)
-        return reporter
+        """Return the shared spec-ed UI reporter with call state cleared."""
+        # Also drop any return_value/side_effect a test configured, which
+        # plain reset_mock() would leak into the next test
+        _REPORTER_MOCK.reset_mock(return_value=True, side_effect=True)
+        return _REPORTER_MOCK
+
+    @pytest.fixture
+    def stub_file_manager(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Skip the FileManager mkdir for tests that never write files."""
+
+        def no_mkdir_init(self: FileManager, base_output_dir: Path, **kwargs: object) -> None:
+            self.base_output_dir = base_output_dir
+
+        monkeypatch.setattr(FileManager, "__init__", no_mkdir_init)
+
+    @pytest.fixture
+    def patched_load(self, monkeypatch: pytest.MonkeyPatch) -> Image.Image:
+        """Make every load_image call return the shared fake screenshot."""
+        monkeypatch.setattr(
+            "auto_appscreenshots.image_processor.ImageProcessor.load_image",
+            lambda self, path, target_size=None: _FAKE_LOAD_IMG,
+        )
+        return _FAKE_LOAD_IMG
 
     @pytest.fixture
     def generator_config(self, sample_image: Path) -> ScreenshotConfig:
@@ -54,7 +83,9 @@ class TestScreenshotGenerator:
         )
         return config
 
-    def test_init(self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock) -> None:
+    def test_init(
+        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, stub_file_manager: None
+    ) -> None:
         """Test generator initialization."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
 
@@ -63,18 +94,17 @@ class TestScreenshotGenerator:
         assert generator.ui_reporter == mock_reporter
 
     def test_generate_all_languages(
-        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, mock_font: Mock
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        mock_font: Mock,
+        patched_load: Image.Image,
     ) -> None:
         """Test generating screenshots for all languages."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
 
-        # Mock image processing
-        with patch.object(generator.image_processor, "load_image") as mock_load:
-            # Create a real image instead of mock for proper behavior
-            real_image = Image.new("RGBA", (1000, 2000), color=(255, 255, 255, 255))
-            mock_load.return_value = real_image
-
-            generated_files = generator.generate_all()
+        generated_files = generator.generate_all()
 
         # Should generate 2 languages × 1 resolution × 1 screenshot = 2 files
         assert len(generated_files) == 2
@@ -84,17 +114,70 @@ class TestScreenshotGenerator:
         mock_reporter.report_language_start.assert_any_call("en")
         mock_reporter.report_language_start.assert_any_call("ja")
 
+    def test_generate_all_parallel(
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        sample_image: Path,
+    ) -> None:
+        """Test parallel generation produces all files and serial-order events."""
+        # A second screenshot so ordering within a language is observable
+        generator_config.screenshots.append(
+            Screenshot(
+                input_image=str(sample_image),
+                text=LocalizedTextContent(main_text={"en": "Second", "ja": "二枚目"}),
+            )
+        )
+        generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
+
+        generated_files = generator.generate_all(max_workers=2)
+
+        # 2 languages × 2 screenshots × 1 resolution = 4 files
+        assert len(generated_files) == 4
+        assert all(path.exists() for path in generated_files)
+
+        # Events must replay in submission order even though tasks can
+        # finish out of order on the pool
+        assert [name for name, *_ in mock_reporter.method_calls] == [
+            "report_language_start",
+            "report_screenshot_start",
+            "report_screenshot_success",
+            "report_screenshot_start",
+            "report_screenshot_success",
+            "report_language_start",
+            "report_screenshot_start",
+            "report_screenshot_success",
+            "report_screenshot_start",
+            "report_screenshot_success",
+        ]
+        assert [call.args[0] for call in mock_reporter.report_language_start.call_args_list] == ["en", "ja"]
+        assert [call.args[0] for call in mock_reporter.report_screenshot_start.call_args_list] == [1, 2, 1, 2]
+
+    def test_generate_all_parallel_error(
+        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock
+    ) -> None:
+        """Test that a failing worker task reports the error and raises."""
+        generator_config.screenshots[0].input_image = "nonexistent.png"
+        generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
+
+        with pytest.raises(FileNotFoundError):
+            generator.generate_all(max_workers=2)
+
+        mock_reporter.report_screenshot_error.assert_called()
+
     def test_generate_specific_language(
-        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, mock_font: Mock
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        mock_font: Mock,
+        patched_load: Image.Image,
     ) -> None:
         """Test generating screenshots for specific language."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
 
-        with patch.object(generator.image_processor, "load_image") as mock_load:
-            real_image = Image.new("RGBA", (1000, 2000), color=(255, 255, 255, 255))
-            mock_load.return_value = real_image
-
-            generated_files = generator.generate_all(language="ja")
+        generated_files = generator.generate_all(language="ja")
 
         # Should only generate for Japanese
         assert len(generated_files) == 1
@@ -128,23 +211,29 @@ class TestScreenshotGenerator:
         assert "No main_text defined for language 'fr'" in str(exc_info.value)
 
     def test_generate_single_resolution(
-        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, mock_font: Mock
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        mock_font: Mock,
+        patched_load: Image.Image,
     ) -> None:
         """Test generating a single resolution screenshot."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
 
-        with patch.object(generator.image_processor, "load_image") as mock_load:
-            real_image = Image.new("RGBA", (1000, 2000), color=(255, 255, 255, 255))
-            mock_load.return_value = real_image
-
-            paths = generator.generate_screenshot(generator_config.screenshots[0], index=1, language="en")
+        paths = generator.generate_screenshot(generator_config.screenshots[0], index=1, language="en")
 
         assert len(paths) == 1  # One resolution
         assert paths[0].parent.parent.name == "en"
         assert "1320x2868" in str(paths[0])
 
     def test_render_texts(
-        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, mock_font: Mock
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        mock_font: Mock,
+        stub_file_manager: None,
     ) -> None:
         """Test text rendering on canvas."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
@@ -152,24 +241,31 @@ class TestScreenshotGenerator:
         mock_draw = MagicMock(spec=ImageDraw.ImageDraw)
         screenshot = generator_config.screenshots[0]
 
-        # Mock text renderer
-        with patch.object(generator.text_renderer, "render_text") as mock_render:
-            # Test rendering both main and sub text
-            generator._render_texts(
-                draw=mock_draw,
-                screenshot=screenshot,
-                main_text="Main",
-                sub_text="Sub",
-                canvas_width=1320,
-                text_area_height=400,
-                language="en",
-            )
+        # Count render_text calls with a plain closure instead of a MagicMock
+        calls: list[None] = []
+        generator.text_renderer.render_text = lambda *args, **kwargs: calls.append(None)  # type: ignore[method-assign]
+
+        # Test rendering both main and sub text
+        generator._render_texts(
+            draw=mock_draw,
+            screenshot=screenshot,
+            main_text="Main",
+            sub_text="Sub",
+            canvas_width=1320,
+            text_area_height=400,
+            language="en",
+        )
 
-            # Should render both texts
-            assert mock_render.call_count == 2
+        # Should render both texts
+        assert len(calls) == 2
 
     def test_render_texts_no_subtitle(
-        self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock, mock_font: Mock
+        self,
+        generator_config: ScreenshotConfig,
+        temp_dir: Path,
+        mock_reporter: Mock,
+        mock_font: Mock,
+        stub_file_manager: None,
     ) -> None:
         """Test text rendering without subtitle."""
         generator = ScreenshotGenerator(config=generator_config, output_dir=temp_dir, ui_reporter=mock_reporter)
@@ -177,20 +273,21 @@ class TestScreenshotGenerator:
         mock_draw = MagicMock(spec=ImageDraw.ImageDraw)
         screenshot = generator_config.screenshots[0]
 
-        # Mock text renderer
-        with patch.object(generator.text_renderer, "render_text") as mock_render:
-            generator._render_texts(
-                draw=mock_draw,
-                screenshot=screenshot,
-                main_text="Main",
-                sub_text=None,  # No subtitle
-                canvas_width=1320,
-                text_area_height=400,
-                language="en",
-            )
+        calls: list[None] = []
+        generator.text_renderer.render_text = lambda *args, **kwargs: calls.append(None)  # type: ignore[method-assign]
+
+        generator._render_texts(
+            draw=mock_draw,
+            screenshot=screenshot,
+            main_text="Main",
+            sub_text=None,  # No subtitle
+            canvas_width=1320,
+            text_area_height=400,
+            language="en",
+        )
 
-            # Should only render main text
-            assert mock_render.call_count == 1
+        # Should only render main text
+        assert len(calls) == 1
 
     def test_error_reporting(self, generator_config: ScreenshotConfig, temp_dir: Path, mock_reporter: Mock) -> None:
         """Test that errors are properly reported."""
@@ -206,7 +303,7 @@ class TestScreenshotGenerator:
         mock_reporter.report_screenshot_error.assert_called()
 
     def test_multiple_resolutions(
-        self, temp_dir: Path, mock_reporter: Mock, sample_image: Path, mock_font: Mock
+        self, temp_dir: Path, mock_reporter: Mock, sample_image: Path, mock_font: Mock, patched_load: Image.Image
     ) -> None:
         """Test generating multiple resolutions."""
         screenshot = Screenshot(input_image=str(sample_image), text=LocalizedTextContent(main_text={"en": "Test"}))
@@ -220,11 +317,7 @@ class TestScreenshotGenerator:
 
         generator = ScreenshotGenerator(config=config, output_dir=temp_dir, ui_reporter=mock_reporter)
 
-        with patch.object(generator.image_processor, "load_image") as mock_load:
-            real_image = Image.new("RGBA", (1000, 2000), color=(255, 255, 255, 255))
-            mock_load.return_value = real_image
-
-            paths = generator.generate_screenshot(screenshot, index=1, language="en")
+        paths = generator.generate_screenshot(screenshot, index=1, language="en")
 
         assert len(paths) == 2  # Two resolutions
         assert any("1320x2868" in str(p) for p in paths)
@@ -94,9 +94,9 @@ class TestIntegration:
         assert (output_dir / "ja" / "1320x2868" / "01_welcome_ja.png").exists()
 
         # Load and verify generated image properties
-        generated_img = Image.open(output_dir / "en" / "1320x2868" / "01_welcome_en.png")
-        assert generated_img.size == (1320, 2868)
-        assert generated_img.mode == "RGBA"
+        with Image.open(output_dir / "en" / "1320x2868" / "01_welcome_en.png") as generated_img:
+            assert generated_img.size == (1320, 2868)
+            assert generated_img.mode == "RGBA"
 
     @pytest.mark.integration
     def test_color_inheritance(self, temp_dir: Path) -> None:
@@ -0,0 +1,77 @@
+"""Tests for the configuration parse cache."""
+
+from pathlib import Path
+
+import pytest
+
+from auto_appscreenshots.models import ScreenshotConfig
+from auto_appscreenshots.parse_cache import get_cache_dir, load_cached_config, store_cached_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the cache directory into the test's temp directory."""
+    cache_root = temp_dir / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root))
+    return cache_root
+
+
+class TestParseCache:
+    """Test parse cache round-trips and invalidation."""
+
+    def test_get_cache_dir_respects_xdg(self, isolated_cache_dir: Path) -> None:
+        """Test cache directory honors $XDG_CACHE_HOME."""
+        assert get_cache_dir() == isolated_cache_dir / "auto-appscreenshots"
+
+    def test_miss_on_unknown_file(self, temp_dir: Path) -> None:
+        """Test load returns None when nothing was stored."""
+        config_path = temp_dir / "config.yml"
+        config_path.write_text("screenshots: []")
+
+        assert load_cached_config(config_path) is None
+
+    def test_store_and_load_roundtrip(self, temp_dir: Path, screenshot_config: ScreenshotConfig) -> None:
+        """Test a stored config is returned on the next load."""
+        config_path = temp_dir / "config.yml"
+        config_path.write_text("languages: [en, ja]")
+
+        store_cached_config(config_path, screenshot_config)
+        loaded = load_cached_config(config_path)
+
+        assert loaded is not None
+        assert loaded == screenshot_config
+
+    def test_invalidated_on_content_change(self, temp_dir: Path, screenshot_config: ScreenshotConfig) -> None:
+        """Test changing the file content misses the cache."""
+        config_path = temp_dir / "config.yml"
+        config_path.write_text("languages: [en]")
+        store_cached_config(config_path, screenshot_config)
+
+        config_path.write_text("languages: [en, ja]")
+
+        assert load_cached_config(config_path) is None
+
+    def test_invalidated_on_mtime_change(self, temp_dir: Path, screenshot_config: ScreenshotConfig) -> None:
+        """Test touching the file (same content, new mtime) misses the cache."""
+        import os
+
+        config_path = temp_dir / "config.yml"
+        config_path.write_text("languages: [en]")
+        store_cached_config(config_path, screenshot_config)
+
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_cached_config(config_path) is None
+
+    def test_corrupt_cache_entry_is_ignored(self, temp_dir: Path, screenshot_config: ScreenshotConfig) -> None:
+        """Test a corrupt cache file falls back to a miss instead of raising."""
+        config_path = temp_dir / "config.yml"
+        config_path.write_text("languages: [en]")
+        store_cached_config(config_path, screenshot_config)
+
+        cache_files = list(get_cache_dir().glob("*.pkl"))
+        assert len(cache_files) == 1
+        cache_files[0].write_bytes(b"not a pickle")
+
+        assert load_cached_config(config_path) is None
@@ -2,7 +2,7 @@
 
 import pytest
 
-from auto_appscreenshots.preset_themes import PresetThemeName, PresetThemes
+from auto_appscreenshots.preset_themes import PresetThemes
 
 
 class TestPresetThemes:
@@ -10,14 +10,14 @@ class TestPresetThemes:
 
     def test_get_theme_config_standard(self) -> None:
         """Test getting standard theme configuration."""
-        config = PresetThemes.get_theme_config(PresetThemeName.STANDARD)
+        config = PresetThemes.get_theme_config("standard")
 
         assert config["text_layout"] == "standard"
         assert "description" in config
 
     def test_get_theme_config_standard_inverted(self) -> None:
         """Test getting standard_inverted theme configuration."""
-        config = PresetThemes.get_theme_config(PresetThemeName.STANDARD_INVERTED)
+        config = PresetThemes.get_theme_config("standard_inverted")
 
         assert config["text_layout"] == "inverted"
         assert "description" in config
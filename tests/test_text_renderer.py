@@ -33,9 +33,8 @@ class TestTextRenderer:
 
     def test_render_text_with_shadow(self, mocker: Any) -> None:
         """Test rendering text with shadow."""
-        # Mock font loading
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        mocker.patch("auto_appscreenshots.font_finder.FontFinder.load_font", return_value=mock_font)
+        # Fall back to the default bitmap font so the glyph mask is real
+        mocker.patch("auto_appscreenshots.font_finder.FontFinder.load_font", return_value=None)
 
         # Create renderer and mock draw
         renderer = TextRenderer()
@@ -58,16 +57,14 @@ class TestTextRenderer:
         # Render text
         renderer.render_text(mock_draw, "Test Text", position, style)
 
-        # Verify shadow was drawn
-        assert mock_draw.text.call_count == 2  # Shadow + main text
-
-        # Check shadow call (first call)
-        shadow_call = mock_draw.text.call_args_list[0]
-        assert shadow_call[0][1] == "Test Text"
+        # Glyphs are rasterized once and stamped twice: shadow, then text
+        assert mock_draw.bitmap.call_count == 2
+        mock_draw.text.assert_not_called()
 
-        # Check main text call (second call)
-        main_call = mock_draw.text.call_args_list[1]
-        assert main_call[0][1] == "Test Text"
+        # The shadow stamp is displaced from the text stamp by shadow_offset
+        shadow_xy = mock_draw.bitmap.call_args_list[0][0][0]
+        main_xy = mock_draw.bitmap.call_args_list[1][0][0]
+        assert shadow_xy == (main_xy[0] + 2, main_xy[1] + 2)
 
     def test_render_text_without_shadow(self, mocker: Any) -> None:
         """Test rendering text without shadow."""